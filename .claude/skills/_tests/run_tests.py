@@ -18,6 +18,7 @@ from test_skill_references import main as test_references
 from test_skill_scripts import main as test_scripts
 from test_skill_mixins import main as test_mixins
 from test_manifest_integrity import main as test_manifest
+from test_preflight_checks import main as test_preflight
 
 
 def main():
@@ -37,6 +38,7 @@ def main():
         ("Skill Scripts", test_scripts),
         ("Skill Mixins", test_mixins),
         ("Manifest Integrity", test_manifest),
+        ("Preflight Checks", test_preflight),
     ]
 
     results = []
@@ -0,0 +1,126 @@
+"""
+Test preflight-check root probes.
+
+Validates:
+- Probes answered from the shared project-root listing agree with Path.exists()
+- Dangling symlinks count as missing, as they do for Path.exists()
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from test_utils import SKILLS_DIR, TestResult
+
+sys.path.insert(0, str(SKILLS_DIR / "preflight-check" / "scripts"))
+
+from preflight import PreFlightChecker
+
+
+def _statuses(checker: PreFlightChecker) -> dict:
+    """Map check name to status for the checks recorded so far."""
+    return {check.check_name: (check.status, check.message) for check in checker.report.checks}
+
+
+def test_dangling_symlinks() -> TestResult:
+    """Test that dangling symlinks in the project root are reported as missing."""
+    result = TestResult("Preflight Dangling Symlinks")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "package.json").write_text("{}", encoding="utf-8")
+        (root / ".trees").mkdir()
+        try:
+            for name in ("CLAUDE.md", "node_modules", "vitest.config.ts", ".trees/feature-demo"):
+                os.symlink(root / "missing-target", root / name)
+        except (OSError, NotImplementedError) as e:
+            result.add_warning(f"Symlinks unavailable, skipped: {e}")
+            return result
+
+        checker = PreFlightChecker("demo", root)
+        checker.check_claude_md()
+        checker.check_dependencies()
+        checker.check_test_framework()
+        statuses = _statuses(checker)
+
+        expected = {
+            "CLAUDE.md Existence": ("FAIL", "CLAUDE.md not found at project root"),
+            "Node.js Dependencies": ("WARNING", "node_modules/ not found"),
+            "Test Framework": ("WARNING", "No test configuration found"),
+        }
+        for name, want in expected.items():
+            if statuses.get(name) == want:
+                result.add_pass()
+            else:
+                result.add_fail(f"{name}: expected {want}, got {statuses.get(name)}")
+
+        # The worktree probe reads .trees/ through the same listing helper
+        if checker._trees is not None and not checker._trees.exists("feature-demo"):
+            result.add_pass()
+        else:
+            result.add_fail("Dangling .trees/feature-demo reported as an existing worktree")
+
+    return result
+
+
+def test_present_entries() -> TestResult:
+    """Test that real files and directories in the project root are found."""
+    result = TestResult("Preflight Present Entries")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "package.json").write_text("{}", encoding="utf-8")
+        (root / "node_modules").mkdir()
+        (root / "pytest.ini").write_text("", encoding="utf-8")
+        (root / ".trees" / "feature-demo").mkdir(parents=True)
+
+        checker = PreFlightChecker("demo", root)
+        checker.check_dependencies()
+        checker.check_test_framework()
+        statuses = _statuses(checker)
+
+        expected = {
+            "Node.js Dependencies": ("PASS", "node_modules/ exists"),
+            "Test Framework": ("PASS", "Test framework configured"),
+        }
+        for name, want in expected.items():
+            if statuses.get(name) == want:
+                result.add_pass()
+            else:
+                result.add_fail(f"{name}: expected {want}, got {statuses.get(name)}")
+
+        if checker._trees is not None and checker._trees.exists("feature-demo"):
+            result.add_pass()
+        else:
+            result.add_fail("Existing .trees/feature-demo not found")
+
+    return result
+
+
+def main():
+    """Run all preflight probe tests."""
+    print("=" * 60)
+    print("PREFLIGHT CHECK TESTS")
+    print("=" * 60)
+
+    tests = [
+        test_dangling_symlinks,
+        test_present_entries,
+    ]
+
+    all_passed = True
+    for test_fn in tests:
+        result = test_fn()
+        print(result.details())
+        if not result.is_success():
+            all_passed = False
+
+    print("=" * 60)
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
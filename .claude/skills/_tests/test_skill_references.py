@@ -6,6 +6,7 @@ Validates:
 - References are valid markdown files
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from test_utils import (
     parse_skill_frontmatter,
     check_file_exists,
     extract_references_from_skill,
+    extract_references_and_scripts,
     TestResult
 )
 
@@ -89,6 +91,37 @@ def test_orphan_references() -> TestResult:
     return result
 
 
+def test_extract_references_and_scripts() -> TestResult:
+    """Test that the fused extractor finds what each original pattern finds on its own."""
+    result = TestResult("Fused Reference/Script Extraction")
+
+    cases = [
+        ("See `references/guide.md` and run scripts/tool.py", {"guide.md"}, {"tool.py"}),
+        # A script path inside a reference match must still be reported
+        ("`references/scripts/x.py/ .md`", {"scripts/x.py/ .md"}, {"x.py"}),
+        ("no paths here", set(), set()),
+    ]
+    for skill_dir in get_all_skill_dirs():
+        content = parse_skill_frontmatter(skill_dir)[1]
+        cases.append((
+            content,
+            set(re.findall(r"`references/([^`]+\.md)`", content)),
+            set(re.findall(r"scripts/([^`\s]+\.py)", content)),
+        ))
+
+    for content, want_references, want_scripts in cases:
+        references, scripts = extract_references_and_scripts(content)
+        if set(references) == want_references and set(scripts) == want_scripts:
+            result.add_pass()
+        else:
+            result.add_fail(
+                f"Extraction mismatch for content starting {content[:40]!r}: "
+                f"references={sorted(references)}, scripts={sorted(scripts)}"
+            )
+
+    return result
+
+
 def main():
     """Run all reference tests."""
     print("=" * 60)
@@ -99,6 +132,7 @@ def main():
         test_references_exist,
         test_references_directory,
         test_orphan_references,
+        test_extract_references_and_scripts,
     ]
 
     all_passed = True
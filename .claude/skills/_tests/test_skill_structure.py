@@ -17,6 +17,7 @@ from test_utils import (
     get_all_skill_dirs,
     parse_skill_frontmatter,
     check_file_exists,
+    _parse_simple_frontmatter,
     TestResult
 )
 
@@ -83,6 +84,54 @@ def test_skill_has_content() -> TestResult:
     return result
 
 
+def test_frontmatter_fast_path() -> TestResult:
+    """Test that the PyYAML-free frontmatter parser agrees with yaml.safe_load."""
+    import yaml
+
+    result = TestResult("Frontmatter Fast Path")
+
+    samples = [
+        # Plain strings the fast path handles itself
+        "name: my-skill\ndescription: Does things, quickly.",
+        "title: Ünïcode ✓ text",
+        # Values YAML resolves to non-strings or rejects; must be handed off
+        "version: 0b1010",
+        "version: +0x1F",
+        "time: 1:20",
+        "enabled: yes",
+        "date: 2024-01-31",
+        "x: =",
+        "k: <<",
+        "h: foo\t#c",
+        "l: a\tb",
+        "c: value # comment",
+        "n: ~",
+        "q: 'quoted'",
+    ]
+    samples.extend(
+        skill_md.read_text(encoding="utf-8").split("---", 2)[1]
+        for skill_md in (d / "SKILL.md" for d in get_all_skill_dirs())
+        if skill_md.is_file() and skill_md.read_text(encoding="utf-8").startswith("---")
+    )
+
+    for text in samples:
+        fast = _parse_simple_frontmatter(text)
+        if fast is None:
+            result.add_pass()
+            continue
+        try:
+            expected = yaml.safe_load(text) or {}
+        except yaml.YAMLError:
+            result.add_fail(f"Fast path accepted frontmatter PyYAML rejects: {text!r}")
+            continue
+        if fast == expected:
+            result.add_pass()
+        else:
+            result.add_fail(f"Fast path gave {fast!r}, PyYAML gave {expected!r}")
+
+    return result
+
+
 def main():
     """Run all structure tests."""
     print("=" * 60)
@@ -92,6 +141,7 @@ def main():
     tests = [
         test_skill_structure,
         test_skill_has_content,
+        test_frontmatter_fast_path,
     ]
 
     all_passed = True
@@ -3,10 +3,12 @@ Utility functions for skill testing.
 """
 
 import os
+import sys
 import json
+import functools
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # Base paths
 SKILLS_DIR = Path(__file__).parent.parent
@@ -40,6 +42,57 @@ def load_mixins_manifest() -> Dict:
         return json.load(f)
 
 
+# Flat `key: value` frontmatter lines that can be parsed without PyYAML
+_FRONTMATTER_LINE_RE = re.compile(r"^([A-Za-z_][\w-]*):[ \t]+(\S.*?)[ \t]*$")
+# Scalars YAML resolves to non-strings (numbers, booleans, null, dates)
+_YAML_NON_STRING_RE = re.compile(
+    r"^(?:[-+]?(?:\d[\d_]*)?(?:\.[\d_]*)?(?:[eE][-+]?\d+)?"
+    r"|[-+]?0b[01_]+|[-+]?0x[\da-fA-F_]+|[-+]?0o?[0-7_]+|[-+]?\.(?:inf|nan)"
+    r"|y|n|yes|no|true|false|on|off|null|~|\d{4}-\d\d?-\d\d?.*)$",
+    re.IGNORECASE,
+)
+# Characters outside what PyYAML reads as printable, plus the BOM, carriage
+# returns (text-mode reads already normalize them away) and the line
+# breaks str.splitlines() honours but YAML treats differently
+_NON_PLAIN_CHAR_RE = re.compile(
+    "[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]"
+)
+# (SKILL.md path, mtime_ns) of files whose frontmatter failed to parse
+_BAD_FRONTMATTER: set = set()
+_YAML_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+# Characters that make PyYAML resolve a plain scalar differently or reject it:
+# sexagesimal numbers (1:20) and the `=` value and `<<` merge tags
+_YAML_HANDOFF_CHARS = frozenset(":=<")
+
+
+def _parse_simple_frontmatter(text: str) -> Optional[Dict]:
+    """
+    Parse frontmatter made only of plain `key: value` string pairs.
+    Returns None when the block needs a real YAML parser.
+    """
+    if _NON_PLAIN_CHAR_RE.search(text):
+        return None
+    frontmatter = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        # PyYAML is strict about tabs, so leave any line containing one to it
+        match = "\t" not in line and _FRONTMATTER_LINE_RE.match(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if (
+            value[0] in _YAML_INDICATORS
+            or not _YAML_HANDOFF_CHARS.isdisjoint(value)
+            or " #" in value
+            or _YAML_NON_STRING_RE.match(key)
+            or _YAML_NON_STRING_RE.match(value)
+        ):
+            return None
+        frontmatter[key] = value
+    return frontmatter
+
+
 def parse_skill_frontmatter(skill_path: Path) -> Tuple[Dict, str]:
     """
     Parse SKILL.md frontmatter and content.
@@ -51,6 +104,7 @@ def parse_skill_frontmatter(skill_path: Path) -> Tuple[Dict, str]:
 
     with open(skill_md, "r", encoding="utf-8") as f:
         content = f.read()
+        cache_key = (str(skill_md), os.fstat(f.fileno()).st_mtime_ns)
 
     # Parse YAML frontmatter
     frontmatter = {}
@@ -59,40 +113,60 @@ def parse_skill_frontmatter(skill_path: Path) -> Tuple[Dict, str]:
     if content.startswith("---"):
         parts = content.split("---", 2)
         if len(parts) >= 3:
-            import yaml
-            try:
-                frontmatter = yaml.safe_load(parts[1]) or {}
-            except:
-                frontmatter = {}
             body = parts[2]
+            if cache_key in _BAD_FRONTMATTER:
+                return {}, body
+
+            frontmatter = _parse_simple_frontmatter(parts[1])
+            if frontmatter is None:
+                # Slow path: only import PyYAML for non-trivial frontmatter
+                import yaml
+                try:
+                    frontmatter = yaml.safe_load(parts[1]) or {}
+                except yaml.YAMLError as e:
+                    _BAD_FRONTMATTER.add(cache_key)
+                    print(f"WARNING: {skill_md}: invalid frontmatter: {e}", file=sys.stderr)
+                    frontmatter = {}
 
     return frontmatter, body
 
 
 def check_file_exists(path: Path) -> bool:
     """Check if a file exists."""
-    return path.exists() and path.is_file()
+    return os.path.isfile(path)
 
 
 def check_dir_exists(path: Path) -> bool:
     """Check if a directory exists."""
-    return path.exists() and path.is_dir()
+    return os.path.isdir(path)
+
+
+# Match patterns like `references/filename.md` and scripts/filename.py. The two
+# are scanned separately: a reference match may itself contain a script path.
+_REFERENCE_RE = re.compile(r"`references/([^`]+\.md)`")
+_SCRIPT_RE = re.compile(r"scripts/([^`\s]+\.py)")
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_references_and_scripts(content: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Scan skill content once per distinct text; the test modules share the result."""
+    return frozenset(_REFERENCE_RE.findall(content)), frozenset(_SCRIPT_RE.findall(content))
+
+
+def extract_references_and_scripts(content: str) -> Tuple[List[str], List[str]]:
+    """Extract reference and script file paths from skill content."""
+    references, scripts = _scan_references_and_scripts(content)
+    return list(references), list(scripts)
 
 
 def extract_references_from_skill(content: str) -> List[str]:
     """Extract reference file paths from skill content."""
-    # Match patterns like `references/filename.md`
-    pattern = r"`references/([^`]+\.md)`"
-    matches = re.findall(pattern, content)
-    return list(set(matches))
+    return extract_references_and_scripts(content)[0]
 
 
 def extract_scripts_from_skill(content: str) -> List[str]:
     """Extract script file paths from skill content."""
-    # Match patterns like `scripts/filename.py`
-    pattern = r"scripts/([^`\s]+\.py)"
-    matches = re.findall(pattern, content)
-    return list(set(matches))
+    return extract_references_and_scripts(content)[1]
 
 
 class TestResult:
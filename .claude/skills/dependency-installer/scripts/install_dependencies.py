@@ -15,6 +15,9 @@ Options:
     --help           Show this help message
 """
 
+import base64
+import functools
+import hashlib
 import os
 import sys
 import subprocess
@@ -58,6 +61,30 @@ def print_info(message: str):
     print(f"{Colors.BOLD}ℹ️  {message}{Colors.RESET}")
 
 
+# Lock files in detection priority order. When several are present the
+# first match wins, so this order is part of the detection semantics.
+LOCKFILE_ORDER = (
+    # Node.js package managers
+    ("pnpm-lock.yaml", ("pnpm", "node")),
+    ("yarn.lock", ("yarn", "node")),
+    ("package-lock.json", ("npm", "node")),
+    ("bun.lockb", ("bun", "node")),
+    ("package.json", ("npm", "node")),  # Default to npm if package.json exists
+    # Python package managers
+    ("poetry.lock", ("poetry", "python")),
+    ("Pipfile.lock", ("pipenv", "python")),
+    ("requirements.txt", ("pip", "python")),
+    # Ruby
+    ("Gemfile.lock", ("bundle", "ruby")),
+    # Rust
+    ("Cargo.lock", ("cargo", "rust")),
+    # Go
+    ("go.mod", ("go", "go")),
+    # PHP
+    ("composer.lock", ("composer", "php")),
+)
+
+
 def detect_package_manager(project_root: Path) -> Tuple[Optional[str], Optional[str]]:
     """
     Detect package manager from lock files.
@@ -65,43 +92,51 @@ def detect_package_manager(project_root: Path) -> Tuple[Optional[str], Optional[
     Returns:
         Tuple of (package_manager_name, language)
     """
-    # Node.js package managers
-    if (project_root / "pnpm-lock.yaml").exists():
-        return ("pnpm", "node")
-    elif (project_root / "yarn.lock").exists():
-        return ("yarn", "node")
-    elif (project_root / "package-lock.json").exists():
-        return ("npm", "node")
-    elif (project_root / "bun.lockb").exists():
-        return ("bun", "node")
-    elif (project_root / "package.json").exists():
-        return ("npm", "node")  # Default to npm if package.json exists
+    project_root = project_root.resolve()
+    try:
+        mtime_ns = project_root.stat().st_mtime_ns
+    except OSError:
+        return (None, None)
+    return _detect_package_manager(project_root, mtime_ns)
 
-    # Python package managers
-    elif (project_root / "poetry.lock").exists():
-        return ("poetry", "python")
-    elif (project_root / "Pipfile.lock").exists():
-        return ("pipenv", "python")
-    elif (project_root / "requirements.txt").exists():
-        return ("pip", "python")
 
-    # Ruby
-    elif (project_root / "Gemfile.lock").exists():
-        return ("bundle", "ruby")
+@functools.lru_cache(maxsize=32)
+def _detect_package_manager(project_root: Path, mtime_ns: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Cached lock file probe. mtime_ns is part of the cache key so that
+    adding or removing a lock file invalidates the entry.
+    """
+    try:
+        with os.scandir(project_root) as it:
+            present = {entry.name for entry in it}
+    except OSError:
+        return (None, None)
 
-    # Rust
-    elif (project_root / "Cargo.lock").exists():
-        return ("cargo", "rust")
+    for lockfile, detected in LOCKFILE_ORDER:
+        if lockfile in present:
+            return detected
 
-    # Go
-    elif (project_root / "go.mod").exists():
-        return ("go", "go")
+    return (None, None)
 
-    # PHP
-    elif (project_root / "composer.lock").exists():
-        return ("composer", "php")
 
-    return (None, None)
+def poetry_env_in_cache(project_root: Path) -> bool:
+    """Check poetry's virtualenvs directory for this project's environment"""
+    if os.environ.get("POETRY_VIRTUALENVS_PATH"):
+        venvs_dir = Path(os.environ["POETRY_VIRTUALENVS_PATH"])
+    elif os.environ.get("POETRY_CACHE_DIR"):
+        venvs_dir = Path(os.environ["POETRY_CACHE_DIR"]) / "virtualenvs"
+    elif sys.platform == "darwin":
+        venvs_dir = Path.home() / "Library" / "Caches" / "pypoetry" / "virtualenvs"
+    else:
+        venvs_dir = Path.home() / ".cache" / "pypoetry" / "virtualenvs"
+
+    if not venvs_dir.is_dir():
+        return False
+
+    # Poetry names envs "{project-name}-{hash}-py{X.Y}", hashing the project path
+    digest = hashlib.sha256(str(project_root.resolve()).encode()).digest()
+    path_hash = base64.urlsafe_b64encode(digest).decode()[:8]
+    return any(venvs_dir.glob(f"*-{path_hash}-py*"))
 
 
 def check_if_installed(pkg_manager: str, project_root: Path) -> bool:
@@ -111,7 +146,10 @@ def check_if_installed(pkg_manager: str, project_root: Path) -> bool:
     elif pkg_manager == "pip":
         return (project_root / "venv").exists() or (project_root / ".venv").exists()
     elif pkg_manager == "poetry":
-        # Check if poetry env exists
+        # In-project virtualenv or one in poetry's virtualenvs cache dir
+        if (project_root / ".venv").is_dir() or poetry_env_in_cache(project_root):
+            return True
+        # Fall back to asking poetry (slow: spawns a Python process)
         result = subprocess.run(
             ["poetry", "env", "info", "--path"],
             cwd=project_root,
@@ -197,54 +235,46 @@ def get_install_command(
     return []
 
 
-def run_security_audit(pkg_manager: str, project_root: Path) -> bool:
-    """Run security audit if supported"""
-    if pkg_manager == "npm":
-        print_step("Running security audit...")
-        result = subprocess.run(
-            ["npm", "audit", "--production"],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print_warning("Security vulnerabilities found. Run 'npm audit fix' to resolve.")
-            return False
-        else:
-            print_success("No security vulnerabilities found")
-            return True
+AUDIT_COMMANDS = {
+    "npm": (["npm", "audit", "--production"], "Security vulnerabilities found. Run 'npm audit fix' to resolve."),
+    "pnpm": (["pnpm", "audit", "--production"], "Security vulnerabilities found."),
+    "yarn": (["yarn", "audit"], "Security vulnerabilities found."),
+}
 
-    elif pkg_manager == "pnpm":
-        print_step("Running security audit...")
-        result = subprocess.run(
-            ["pnpm", "audit", "--production"],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print_warning("Security vulnerabilities found.")
-            return False
-        else:
-            print_success("No security vulnerabilities found")
-            return True
 
-    elif pkg_manager == "yarn":
-        print_step("Running security audit...")
-        result = subprocess.run(
-            ["yarn", "audit"],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print_warning("Security vulnerabilities found.")
-            return False
-        else:
-            print_success("No security vulnerabilities found")
-            return True
+def start_security_audit(pkg_manager: str, project_root: Path) -> Optional[subprocess.Popen]:
+    """Start the security audit in the background if supported"""
+    if pkg_manager not in AUDIT_COMMANDS:
+        return None
+
+    audit_cmd, _ = AUDIT_COMMANDS[pkg_manager]
+    return subprocess.Popen(
+        audit_cmd,
+        cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
 
-    return True
+def finish_security_audit(pkg_manager: str, audit_proc: Optional[subprocess.Popen]) -> bool:
+    """Wait for a background security audit and report its result"""
+    if audit_proc is None:
+        return True
+
+    print_step("Running security audit...")
+    audit_proc.communicate()
+    if audit_proc.returncode != 0:
+        print_warning(AUDIT_COMMANDS[pkg_manager][1])
+        return False
+    else:
+        print_success("No security vulnerabilities found")
+        return True
+
+
+def run_security_audit(pkg_manager: str, project_root: Path) -> bool:
+    """Run security audit if supported"""
+    return finish_security_audit(pkg_manager, start_security_audit(pkg_manager, project_root))
 
 
 def count_packages(pkg_manager: str, project_root: Path) -> int:
@@ -327,15 +357,20 @@ def main():
 
         print(f"\n{Colors.GREEN}{Colors.BOLD}✅ Installation completed in {duration:.1f}s{Colors.RESET}\n")
 
+        # Start security audit so it overlaps with package counting
+        audit_proc = None
+        if not skip_audit and pkg_manager in AUDIT_COMMANDS:
+            audit_proc = start_security_audit(pkg_manager, project_root)
+
         # Count packages
         pkg_count = count_packages(pkg_manager, project_root)
         if pkg_count > 0:
             print_info(f"Total packages installed: {pkg_count}")
 
-        # Run security audit
-        if not skip_audit and pkg_manager in ["npm", "pnpm", "yarn"]:
+        # Wait for security audit
+        if audit_proc is not None:
             print()
-            run_security_audit(pkg_manager, project_root)
+            finish_security_audit(pkg_manager, audit_proc)
 
         # Print next steps
         print(f"\n{Colors.BOLD}🎉 Ready to develop!{Colors.RESET}")
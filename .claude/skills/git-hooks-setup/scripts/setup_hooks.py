@@ -19,12 +19,64 @@ Last Modified: 2026-01-09
 import os
 import sys
 import json
+import re
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+try:
+    import orjson
+
+    def _jloads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _jdumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS) + b"\n"
+except ImportError:  # orjson is optional; fall back to stdlib json
+    # Built once instead of per json.dumps() call
+    _JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def _jloads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _jdumps(obj: Any) -> bytes:
+        return (_JSON_ENCODER.encode(obj) + "\n").encode("utf-8")
+
+# Requirement keys and the command snippets that identify them in CLAUDE.md
+COMMAND_MARKERS = {
+    "test_command": ("pnpm test", "npm test"),
+    "lint_command": ("pnpm lint", "npm run lint"),
+    "format_command": ("pnpm format", "npm run format"),
+    "type_check_command": ("pnpm type-check", "tsc"),
+}
+# Whole lines mentioning any command marker
+CMD_LINE_RE = re.compile(
+    r"^.*(?:"
+    + "|".join(re.escape(m) for markers in COMMAND_MARKERS.values() for m in markers)
+    + r").*$",
+    re.MULTILINE,
+)
+PM_RE = re.compile(r"npm install|yarn install", re.IGNORECASE)
+# Dev dependencies required by the generated hooks
+HOOK_DEPENDENCIES = [
+    "husky",
+    "lint-staged",
+    "@commitlint/cli",
+    "@commitlint/config-conventional",
+]
+# Hook scripts shipped in assets/hooks, in creation order
+HOOK_FILES = ("pre-commit", "commit-msg", "pre-push")
+# Config files shipped in assets and copied to the project root
+CONFIG_FILES = ("commitlint.config.js", "lint-staged.config.js")
+# Bump whenever extract_requirements changes so stale cached results are ignored
+REQUIREMENTS_CACHE_VERSION = 1
+
+
 class HooksSetup:
     """Manages Git hooks setup for a project based on CLAUDE.md"""
 
@@ -34,15 +86,57 @@ class HooksSetup:
         self.package_json = project_root / "package.json"
         self.husky_dir = project_root / ".husky"
         self.skill_dir = Path(__file__).parent.parent
+        self.cache_path = project_root / ".claude" / ".hooks_cache.json"
+        self._claude_md_key: Optional[List[int]] = None
+        self._req_cache: Optional[Dict[str, Any]] = None
+        self._pkg_json: Optional[Dict[str, Any]] = None
+        self._pkg_mtime: Optional[int] = None
+        self._pkg_dirty = False
 
     def read_claude_md(self) -> str:
         """Read CLAUDE.md file"""
         if not self.claude_md.exists():
             raise FileNotFoundError(f"CLAUDE.md not found at {self.claude_md}")
+
+        # Reuse requirements parsed on a previous run if CLAUDE.md is unchanged
+        st = self.claude_md.stat()
+        self._claude_md_key = [REQUIREMENTS_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+        try:
+            cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if cache.get("key") == self._claude_md_key:
+                self._req_cache = cache["requirements"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self._req_cache = None
+
         return self.claude_md.read_text(encoding="utf-8")
 
+    def write_requirements_cache(self, requirements: Dict[str, Any]) -> None:
+        """Atomically persist parsed requirements keyed by cache version and CLAUDE.md mtime/size"""
+        if self._claude_md_key is None:
+            return
+
+        tmp_path = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".hooks_cache.", suffix=".tmp", dir=self.cache_path.parent
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": self._claude_md_key, "requirements": requirements}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # The cache is only an optimization; don't leave a partial file behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     def extract_requirements(self, content: str) -> Dict[str, Any]:
         """Extract testing, linting, and formatting requirements from CLAUDE.md"""
+        if self._req_cache is not None:
+            return self._req_cache
+
         requirements = {
             "test_command": "pnpm test",
             "lint_command": "pnpm lint",
@@ -54,92 +148,140 @@ class HooksSetup:
         }
 
         # Extract package manager
-        if "npm install" in content.lower():
+        installs = {match.lower() for match in PM_RE.findall(content)}
+        if "npm install" in installs:
             requirements["package_manager"] = "npm"
-        elif "yarn install" in content.lower():
+        elif "yarn install" in installs:
             requirements["package_manager"] = "yarn"
 
-        # Extract commands from CLAUDE.md
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if "pnpm test" in line or "npm test" in line:
-                requirements["test_command"] = line.strip("# -`")
-            if "pnpm lint" in line or "npm run lint" in line:
-                requirements["lint_command"] = line.strip("# -`")
-            if "pnpm format" in line or "npm run format" in line:
-                requirements["format_command"] = line.strip("# -`")
-            if "pnpm type-check" in line or "tsc" in line:
-                requirements["type_check_command"] = line.strip("# -`")
+        # Extract commands from CLAUDE.md; only lines mentioning a command
+        # are visited, and the last matching line wins
+        for match in CMD_LINE_RE.finditer(content):
+            line = match.group(0)
+            for key, markers in COMMAND_MARKERS.items():
+                if any(marker in line for marker in markers):
+                    requirements[key] = line.strip("# -`")
 
         return requirements
 
+    def _load_package_json(self) -> Optional[Dict[str, Any]]:
+        """
+        Parse package.json once per run. It is re-read only if a package
+        manager subprocess changed it on disk and there are no pending edits.
+        """
+        try:
+            mtime = self.package_json.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._pkg_json if self._pkg_dirty else None
+
+        if self._pkg_json is None or (mtime != self._pkg_mtime and not self._pkg_dirty):
+            self._pkg_json = _jloads(self.package_json.read_bytes())
+            self._pkg_mtime = mtime
+        return self._pkg_json
+
+    def save_package_json(self) -> None:
+        """Write pending package.json edits in a single write"""
+        if not self._pkg_dirty:
+            return
+        self.package_json.write_bytes(_jdumps(self._pkg_json))
+        self._pkg_mtime = self.package_json.stat().st_mtime_ns
+        self._pkg_dirty = False
+
+    def _missing_deps(self) -> List[str]:
+        """Return hook dependencies not yet listed in package.json devDependencies"""
+        try:
+            package_data = self._load_package_json() or {}
+            # "devDependencies": null is treated like an absent section
+            dev = package_data.get("devDependencies") or {}
+        except (ValueError, AttributeError):
+            dev = {}
+        return [dep for dep in HOOK_DEPENDENCIES if dep not in dev]
+
     def install_dependencies(self, pkg_manager: str) -> bool:
         """Install husky, lint-staged, and commitlint packages"""
         print("📦 Installing dependencies...")
 
-        dependencies = [
-            "husky",
-            "lint-staged",
-            "@commitlint/cli",
-            "@commitlint/config-conventional",
-        ]
+        dependencies = self._missing_deps()
+        if not dependencies:
+            print("✅ Dependencies already installed")
+            return True
 
-        try:
-            if pkg_manager == "pnpm":
-                cmd = ["pnpm", "add", "-D"] + dependencies
-            elif pkg_manager == "yarn":
-                cmd = ["yarn", "add", "--dev"] + dependencies
-            else:
-                cmd = ["npm", "install", "--save-dev"] + dependencies
+        if pkg_manager == "pnpm":
+            cmd = ["pnpm", "add", "-D", "--prefer-offline"] + dependencies
+        elif pkg_manager == "yarn":
+            cmd = ["yarn", "add", "--dev"] + dependencies
+        else:
+            cmd = ["npm", "install", "--save-dev", "--prefer-offline"] + dependencies
 
-            subprocess.run(cmd, check=True, cwd=self.project_root)
-            print("✅ Dependencies installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install dependencies: {e}")
+        proc = subprocess.run(cmd, cwd=self.project_root, capture_output=True, text=True)
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            print(f"❌ Failed to install dependencies (exit code {proc.returncode})")
             return False
 
+        print("✅ Dependencies installed successfully")
+        return True
+
     def init_husky(self, pkg_manager: str) -> bool:
         """Initialize Husky"""
         print("🐕 Initializing Husky...")
 
-        try:
-            if pkg_manager == "pnpm":
-                cmd = ["pnpm", "exec", "husky", "init"]
-            else:
-                cmd = ["npx", "husky", "init"]
+        if pkg_manager == "pnpm":
+            cmd = ["pnpm", "exec", "husky", "init"]
+        else:
+            cmd = ["npx", "husky", "init"]
 
-            subprocess.run(cmd, check=True, cwd=self.project_root)
-            print("✅ Husky initialized")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to initialize Husky: {e}")
+        proc = subprocess.run(cmd, cwd=self.project_root, capture_output=True, text=True)
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            print(f"❌ Failed to initialize Husky (exit code {proc.returncode})")
             return False
 
+        print("✅ Husky initialized")
+        return True
+
     def copy_hook_files(self) -> None:
         """Copy hook files from assets to .husky directory"""
         print("📝 Creating hook files...")
 
         hooks_src = self.skill_dir / "assets" / "hooks"
-        hook_files = ["pre-commit", "commit-msg", "pre-push"]
+        assets = self._scan_files(hooks_src)
 
-        for hook_file in hook_files:
-            src = hooks_src / hook_file
-            dst = self.husky_dir / hook_file
+        for hook_file in HOOK_FILES:
+            src = assets.get(hook_file)
+            if src is None:
+                continue
 
-            if src.exists():
-                # If hook already exists, merge intelligently
-                if dst.exists():
-                    print(f"  ⚠️  {hook_file} already exists, merging...")
-                    self.merge_hook_file(src, dst)
-                else:
-                    shutil.copy2(src, dst)
-                    print(f"  ✅ Created {hook_file}")
-
-                # Make hook executable (Unix-like systems)
-                if os.name != "nt":  # Not Windows
+            dst = self.husky_dir / hook_file
+            try:
+                dst_mode = dst.stat().st_mode
+            except FileNotFoundError:
+                dst_mode = None
+
+            # If hook already exists, merge intelligently
+            if dst_mode is not None:
+                print(f"  ⚠️  {hook_file} already exists, merging...")
+                self.merge_hook_file(Path(src), dst)
+            else:
+                # Metadata is not needed: the mode is set explicitly below
+                shutil.copyfile(src, dst)
+                print(f"  ✅ Created {hook_file}")
+
+            # Make hook executable (Unix-like systems), skipping hooks
+            # that already have the right mode
+            if os.name != "nt":  # Not Windows
+                if dst_mode is None or (dst_mode & 0o777) != 0o755:
                     os.chmod(dst, 0o755)
 
+    @staticmethod
+    def _scan_files(directory: Path) -> Dict[str, str]:
+        """Map file names to paths with a single directory read"""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry.path for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+
     def merge_hook_file(self, src: Path, dst: Path) -> None:
         """Merge existing hook with new hook content"""
         existing_content = dst.read_text(encoding="utf-8")
@@ -150,14 +292,14 @@ class HooksSetup:
             return
 
         # Simple merge: append new commands if not already present
-        lines_to_add = []
-        for line in new_content.split("\n"):
-            if (
-                line.strip()
-                and not line.startswith("#")
-                and line not in existing_content
-            ):
-                lines_to_add.append(line)
+        existing_lines = set(existing_content.splitlines())
+        lines_to_add = [
+            line
+            for line in new_content.split("\n")
+            if line.strip()
+            and not line.startswith("#")
+            and line not in existing_lines
+        ]
 
         if lines_to_add:
             merged = existing_content.rstrip() + "\n\n# Added by hooks-setup skill\n"
@@ -169,82 +311,76 @@ class HooksSetup:
         """Update package.json with lint-staged configuration and scripts"""
         print("📄 Updating package.json...")
 
-        if not self.package_json.exists():
+        package_data = self._load_package_json()
+        if package_data is None:
             print("  ⚠️  package.json not found, skipping")
             return
 
-        with open(self.package_json, "r", encoding="utf-8") as f:
-            package_data = json.load(f)
-
         # Add lint-staged configuration reference
         if "lint-staged" not in package_data:
             package_data["lint-staged"] = {}
+            self._pkg_dirty = True
             print("  ✅ Added lint-staged configuration reference")
 
         # Add prepare script for Husky
         if "scripts" not in package_data:
             package_data["scripts"] = {}
+            self._pkg_dirty = True
 
         if "prepare" not in package_data["scripts"]:
             package_data["scripts"]["prepare"] = "husky"
+            self._pkg_dirty = True
             print("  ✅ Added prepare script for Husky")
 
-        # Write updated package.json
-        with open(self.package_json, "w", encoding="utf-8") as f:
-            json.dump(package_data, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Add trailing newline
-
     def copy_config_files(self) -> None:
         """Copy commitlint and lint-staged config files to project root"""
         print("⚙️  Copying configuration files...")
 
-        # Copy commitlint.config.js
-        commitlint_src = self.skill_dir / "assets" / "commitlint.config.js"
-        commitlint_dst = self.project_root / "commitlint.config.js"
+        assets = self._scan_files(self.skill_dir / "assets")
 
-        if not commitlint_dst.exists() and commitlint_src.exists():
-            shutil.copy2(commitlint_src, commitlint_dst)
-            print("  ✅ Created commitlint.config.js")
-        elif commitlint_dst.exists():
-            print("  ℹ️  commitlint.config.js already exists, skipping")
-
-        # Copy lint-staged.config.js
-        lint_staged_src = self.skill_dir / "assets" / "lint-staged.config.js"
-        lint_staged_dst = self.project_root / "lint-staged.config.js"
-
-        if not lint_staged_dst.exists() and lint_staged_src.exists():
-            shutil.copy2(lint_staged_src, lint_staged_dst)
-            print("  ✅ Created lint-staged.config.js")
-        elif lint_staged_dst.exists():
-            print("  ℹ️  lint-staged.config.js already exists, skipping")
+        for config_file in CONFIG_FILES:
+            dst = self.project_root / config_file
+            if dst.exists():
+                print(f"  ℹ️  {config_file} already exists, skipping")
+            elif config_file in assets:
+                shutil.copyfile(assets[config_file], dst)
+                print(f"  ✅ Created {config_file}")
 
     def run_setup(self) -> bool:
         """Run the complete setup process"""
-        print("🚀 Setting up Git hooks based on CLAUDE.md...\n")
+        out = sys.stdout
+        out.write("🚀 Setting up Git hooks based on CLAUDE.md...\n\n")
 
         try:
             # Read and parse CLAUDE.md
             claude_content = self.read_claude_md()
             requirements = self.extract_requirements(claude_content)
+            if self._req_cache is None:
+                self.write_requirements_cache(requirements)
             pkg_manager = requirements["package_manager"]
 
-            print(f"📋 Detected package manager: {pkg_manager}")
-            print(f"📋 Detected commands:")
-            print(f"   - Test: {requirements['test_command']}")
-            print(f"   - Lint: {requirements['lint_command']}")
-            print(f"   - Format: {requirements['format_command']}")
-            print()
+            out.write(
+                f"📋 Detected package manager: {pkg_manager}\n"
+                "📋 Detected commands:\n"
+                f"   - Test: {requirements['test_command']}\n"
+                f"   - Lint: {requirements['lint_command']}\n"
+                f"   - Format: {requirements['format_command']}\n"
+                "\n"
+            )
+            out.flush()
 
             # Install dependencies
             if not self.install_dependencies(pkg_manager):
                 return False
+            out.flush()
 
             # Initialize Husky
             if not self.husky_dir.exists():
                 if not self.init_husky(pkg_manager):
                     return False
             else:
-                print("🐕 Husky already initialized")
+                out.write("🐕 Husky already initialized\n")
+            out.flush()
 
             # Copy hook files
             self.copy_hook_files()
@@ -252,15 +388,19 @@ class HooksSetup:
             # Copy configuration files
             self.copy_config_files()
 
-            # Update package.json
+            # Update package.json (written once, after all edits)
             self.update_package_json(pkg_manager)
-
-            print("\n✅ Git hooks setup completed successfully!")
-            print("\n📌 Next steps:")
-            print("   1. Review hook files in .husky/ directory")
-            print("   2. Customize commitlint.config.js if needed")
-            print("   3. Customize lint-staged.config.js if needed")
-            print("   4. Test hooks by making a commit")
+            self.save_package_json()
+
+            out.write(
+                "\n✅ Git hooks setup completed successfully!\n"
+                "\n📌 Next steps:\n"
+                "   1. Review hook files in .husky/ directory\n"
+                "   2. Customize commitlint.config.js if needed\n"
+                "   3. Customize lint-staged.config.js if needed\n"
+                "   4. Test hooks by making a commit\n"
+            )
+            out.flush()
 
             return True
 
@@ -272,19 +412,29 @@ class HooksSetup:
             return False
 
 
+def find_project_root(start: str, max_depth: int = 8) -> Optional[Path]:
+    """Walk up from start to the nearest directory containing CLAUDE.md"""
+    current = start
+    for _ in range(max_depth):
+        if os.path.isfile(os.path.join(current, "CLAUDE.md")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    return None
+
+
 def main():
     """Main entry point"""
     # Determine project root
     if len(sys.argv) > 2 and sys.argv[1] == "--project-root":
         project_root = Path(sys.argv[2]).resolve()
     else:
-        # Assume script is run from project root or .claude/skills/hooks-setup/scripts/
-        current = Path.cwd()
-        if (current / "CLAUDE.md").exists():
-            project_root = current
-        elif (current.parent.parent.parent.parent / "CLAUDE.md").exists():
-            project_root = current.parent.parent.parent.parent
-        else:
+        # Assume script is run from project root or somewhere below it,
+        # e.g. .claude/skills/hooks-setup/scripts/
+        project_root = find_project_root(os.getcwd())
+        if project_root is None:
             print(
                 "❌ Could not find CLAUDE.md. Please run from project root or use --project-root"
             )
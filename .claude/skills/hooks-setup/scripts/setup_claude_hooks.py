@@ -16,14 +16,36 @@ Usage:
 Last Modified: 2026-01-10
 """
 
+import functools
 import json
 import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
+@functools.lru_cache(maxsize=32)
+def _detect_package_manager(project_root: Path, mtime_ns: int) -> str:
+    """
+    Detect package manager from lock files.
+
+    mtime_ns is the project root's modification time; it is only used as part
+    of the cache key so that new or removed lock files invalidate the entry.
+    """
+    if (project_root / "pnpm-lock.yaml").exists():
+        return "pnpm"
+    elif (project_root / "yarn.lock").exists():
+        return "yarn"
+    elif (project_root / "bun.lockb").exists():
+        return "bun"
+    elif (project_root / "package-lock.json").exists():
+        return "npm"
+    else:
+        return "npx"  # Default fallback
+
+
 class ClaudeHooksSetup:
     """Configure Claude Code PostToolUse hooks for auto-linting"""
 
@@ -115,16 +137,12 @@ class ClaudeHooksSetup:
 
     def detect_package_manager(self) -> str:
         """Detect package manager from lock files"""
-        if (self.project_root / "pnpm-lock.yaml").exists():
-            return "pnpm"
-        elif (self.project_root / "yarn.lock").exists():
-            return "yarn"
-        elif (self.project_root / "bun.lockb").exists():
-            return "bun"
-        elif (self.project_root / "package-lock.json").exists():
-            return "npm"
-        else:
-            return "npx"  # Default fallback
+        project_root = self.project_root.resolve()
+        try:
+            mtime_ns = project_root.stat().st_mtime_ns
+        except OSError:
+            return "npx"  # No readable project root, so no lock files
+        return _detect_package_manager(project_root, mtime_ns)
 
     def build_hook_command(self, languages: List[str], package_manager: str) -> str:
         """Build the shell command for PostToolUse hook"""
@@ -160,15 +178,12 @@ class ClaudeHooksSetup:
 
             conditions.append(f"if [[ {ext_checks} ]]; then {cmd}")
 
+        if not conditions:
+            return ""
+
         # Join conditions with elif
-        if len(conditions) == 1:
-            return conditions[0] + "; fi"
-        else:
-            command = conditions[0]
-            for cond in conditions[1:]:
-                command += "; el" + cond
-            command += "; fi"
-            return command
+        parts = [conditions[0]] + ["el" + cond for cond in conditions[1:]]
+        return "; ".join(parts) + "; fi"
 
     def generate_hook_config(self, languages: List[str]) -> Dict:
         """Generate Claude Code hook configuration"""
@@ -215,8 +230,27 @@ class ClaudeHooksSetup:
         # Ensure .claude directory exists
         self.settings_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write JSON with nice formatting
-        self.settings_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        # Write JSON with nice formatting to a temp file, then atomically
+        # replace settings.json so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".settings.", suffix=".tmp", dir=self.settings_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2)
+            # mkstemp creates 0600 files; keep the existing file's mode, or
+            # give a new file the mode write_text would (0666 less the umask)
+            try:
+                mode = self.settings_path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.settings_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def run(self) -> Dict:
         """Main execution flow"""
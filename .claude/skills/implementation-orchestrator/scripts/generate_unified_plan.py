@@ -13,11 +13,167 @@ Usage:
 
 import argparse
 import json
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+
+    def _jloads(data: bytes):
+        return orjson.loads(data)
+except ImportError:  # orjson is optional; fall back to stdlib json
+    def _jloads(data: bytes):
+        return json.loads(data)
+
+# File paths in backticks, e.g. `src/app.ts`
+FILE_RE = re.compile(r'`([a-zA-Z0-9_/\-\.]+\.(ts|js|tsx|jsx|py|sql|yml|yaml|json|md))`')
+
+
+_TOC = (
+    "## Table of Contents\n"
+    "\n"
+    "1. [Validation Status](#validation-status)\n"
+    "2. [Execution Order](#execution-order)\n"
+    "3. [File Changes Summary](#file-changes-summary)\n"
+    "4. [Cross-Layer Integration](#cross-layer-integration)\n"
+    "5. [Test Strategy](#test-strategy)\n"
+    "6. [Implementation Checkpoints](#implementation-checkpoints)\n"
+    "7. [Detailed Plans](#detailed-plans)\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+# Fixed section openers, and the full sections used when data is missing
+_NO_VALIDATION = (
+    "## Validation Status\n"
+    "\n"
+    "⚠️ Validation not run\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+_EXECUTION_HEADER = (
+    "## Execution Order\n"
+    "\n"
+    "Implementation should follow this dependency-ordered sequence:\n"
+    "\n"
+)
+
+_NO_EXECUTION = _EXECUTION_HEADER + "No execution plan available.\n\n---\n\n"
+
+_CHECKPOINTS_HEADER = (
+    "## Implementation Checkpoints\n"
+    "\n"
+    "Verify these checkpoints after each implementation step:\n"
+    "\n"
+)
+
+_NO_CHECKPOINTS = _CHECKPOINTS_HEADER + "\n---\n\n"
+
+# ((source plan, target plan), rendered section) for adjacent layers
+_INTEGRATION_POINTS = (
+    (("database", "api_contract"),
+     "### Database ↔ API Contract\n"
+     "\n"
+     "- Database schemas map to API request/response models\n"
+     "- Field naming conventions should align (snake_case in DB, camelCase in API)\n"
+     "- Data type compatibility validated\n"
+     "\n"),
+    (("api_contract", "backend"),
+     "### API Contract ↔ Backend\n"
+     "\n"
+     "- Each API endpoint has corresponding backend handler\n"
+     "- Request/response schemas match backend data transformations\n"
+     "- Error codes defined in API are handled in backend\n"
+     "\n"),
+    (("backend", "frontend"),
+     "### Backend ↔ Frontend\n"
+     "\n"
+     "- Frontend API client calls match backend endpoints\n"
+     "- State management aligns with API response structures\n"
+     "- Error handling covers all API error responses\n"
+     "\n"),
+    (("frontend", "ui_components"),
+     "### Frontend ↔ UI Components\n"
+     "\n"
+     "- All UI components referenced in frontend are defined\n"
+     "- Component props match frontend data structures\n"
+     "- Design system conventions are consistent\n"
+     "\n"),
+)
+
+_TEST_STRATEGY = (
+    ("database", (
+        "Run migrations on test database",
+        "Verify schema integrity",
+        "Test database constraints and indexes",
+    )),
+    ("api_contract", (
+        "Validate OpenAPI/GraphQL schema syntax",
+        "Run contract tests (Pact, Postman)",
+        "Test API documentation accuracy",
+    )),
+    ("backend", (
+        "Unit tests for business logic",
+        "Integration tests for API endpoints",
+        "Test error handling and edge cases",
+    )),
+    ("frontend", (
+        "Integration tests for API calls",
+        "State management tests",
+        "End-to-end tests (Playwright/Cypress)",
+    )),
+    ("ui_components", (
+        "Component unit tests",
+        "Visual regression tests",
+        "Accessibility tests (WCAG compliance)",
+    )),
+)
+
+# (layer, rendered section) pairs, rendered once at import time
+_TEST_STRATEGY_SECTIONS = tuple(
+    (layer,
+     f"### {layer.replace('_', ' ').title()} Tests\n\n"
+     + "".join(f"- {test}\n" for test in tests)
+     + "\n")
+    for layer, tests in _TEST_STRATEGY
+)
+
+
+# File-change categories in the order they are rendered
+FILE_CATEGORIES = (
+    "Database Migrations",
+    "Backend Files",
+    "Frontend Files",
+    "UI Components",
+    "Tests",
+    "Configuration",
+)
+
+
+def _classify(path_lower: str, ext: str, plan_type: str) -> Optional[str]:
+    """Return the file-changes category for a lowercased file path."""
+    if ext == "sql" or "migration" in path_lower:
+        return "Database Migrations"
+    if "test" in path_lower or "spec" in path_lower:
+        return "Tests"
+    if plan_type == "ui_components" or "component" in path_lower:
+        return "UI Components"
+    if ext in ("yml", "yaml", "json") and "config" in path_lower:
+        return "Configuration"
+    if plan_type in ("backend", "domain_logic"):
+        return "Backend Files"
+    if plan_type in ("frontend", "presentation"):
+        return "Frontend Files"
+    return None
 
 
 class UnifiedPlanGenerator:
@@ -40,343 +196,274 @@ class UnifiedPlanGenerator:
             "ui_components": "ui_components.md"
         }
 
-        for plan_type, filename in plan_files.items():
-            filepath = self.plans_dir / filename
-            if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self.plans[plan_type] = f.read()
+        # One directory read instead of a stat per expected plan file
+        with os.scandir(self.plans_dir) as it:
+            present = {entry.name: entry.path for entry in it if entry.is_file()}
+
+        # Read the present files concurrently; file IO releases the GIL
+        with ThreadPoolExecutor(max_workers=len(plan_files)) as executor:
+            futures = {
+                plan_type: executor.submit(Path(present[filename]).read_text, encoding='utf-8')
+                for plan_type, filename in plan_files.items()
+                if filename in present
+            }
+            self.plans = {plan_type: future.result() for plan_type, future in futures.items()}
 
     def run_validation(self) -> bool:
         """Run plan validation script."""
         validation_output = self.plans_dir / "validation_result.json"
-
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(Path(__file__).parent / "validate_plans.py"),
-                "--feature", self.feature,
-                "--plans-dir", str(self.plans_dir),
-                "--output", str(validation_output)
-            ], capture_output=True, text=True, check=True)
-
-            # Load validation results
-            if validation_output.exists():
-                with open(validation_output, 'r') as f:
-                    self.validation_result = json.load(f)
-
-            return True
-
-        except subprocess.CalledProcessError as e:
-            print(f"Validation failed: {e}")
+        # Drop any stale report so a crashed run is not mistaken for a result
+        validation_output.unlink(missing_ok=True)
+
+        proc = subprocess.run([
+            sys.executable,
+            str(Path(__file__).parent / "validate_plans.py"),
+            "--feature", self.feature,
+            "--plans-dir", str(self.plans_dir),
+            "--output", str(validation_output)
+        ], capture_output=True, text=True)
+
+        # Load validation results; validate_plans.py exits 1 when the plans
+        # FAIL validation but still writes the report
+        if validation_output.exists():
+            self.validation_result = _jloads(validation_output.read_bytes())
+
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            print(f"Validation failed with exit code {proc.returncode}")
             return False
 
+        return True
+
     def run_orchestration(self) -> bool:
         """Run orchestration script to get execution order."""
         orchestration_output = self.plans_dir / "execution_plan.json"
 
-        try:
-            result = subprocess.run([
-                sys.executable,
-                str(Path(__file__).parent / "orchestrate.py"),
-                "--feature", self.feature,
-                "--plans-dir", str(self.plans_dir),
-                "--output", str(orchestration_output)
-            ], capture_output=True, text=True, check=True)
+        proc = subprocess.run([
+            sys.executable,
+            str(Path(__file__).parent / "orchestrate.py"),
+            "--feature", self.feature,
+            "--plans-dir", str(self.plans_dir),
+            "--output", str(orchestration_output)
+        ], capture_output=True, text=True)
+
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            print(f"Orchestration failed with exit code {proc.returncode}")
+            return False
 
-            # Load execution plan
-            if orchestration_output.exists():
-                with open(orchestration_output, 'r') as f:
-                    self.execution_plan = json.load(f)
+        # Load execution plan
+        if orchestration_output.exists():
+            self.execution_plan = _jloads(orchestration_output.read_bytes())
 
-            return True
+        return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"Orchestration failed: {e}")
-            return False
+    def run_validation_and_orchestration(self) -> Tuple[bool, bool]:
+        """Run validation and orchestration scripts concurrently.
+
+        Both scripts only read the plan files and write separate outputs,
+        so their interpreter startup and IO can overlap.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            validation = executor.submit(self.run_validation)
+            orchestration = executor.submit(self.run_orchestration)
+            return validation.result(), orchestration.result()
 
     def generate_unified_plan(self) -> str:
         """Generate the unified implementation plan markdown."""
-        lines = []
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
         # Header
-        lines.append(f"# Unified Implementation Plan: {self.feature}")
-        lines.append("")
-        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Feature**: {self.feature}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Table of Contents
-        lines.append("## Table of Contents")
-        lines.append("")
-        lines.append("1. [Validation Status](#validation-status)")
-        lines.append("2. [Execution Order](#execution-order)")
-        lines.append("3. [File Changes Summary](#file-changes-summary)")
-        lines.append("4. [Cross-Layer Integration](#cross-layer-integration)")
-        lines.append("5. [Test Strategy](#test-strategy)")
-        lines.append("6. [Implementation Checkpoints](#implementation-checkpoints)")
-        lines.append("7. [Detailed Plans](#detailed-plans)")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Section 1: Validation Status
-        lines.append("## Validation Status")
-        lines.append("")
-
-        if self.validation_result:
-            status = self.validation_result.get("status", "UNKNOWN")
-            error_count = self.validation_result.get("error_count", 0)
-            warning_count = self.validation_result.get("warning_count", 0)
-
-            if status == "PASS":
-                lines.append("✅ **Status**: PASS")
-                lines.append("")
-                lines.append("All plans are coherent and ready for implementation.")
-            elif status == "WARNINGS":
-                lines.append(f"⚠️ **Status**: WARNINGS ({warning_count} warning(s))")
-                lines.append("")
-                lines.append("Plans have warnings. Review recommended before implementation:")
-                lines.append("")
-                for warning in self.validation_result.get("warnings", []):
-                    lines.append(f"- **[{warning['category']}]** {warning['message']}")
-                    lines.append(f"  - Source: `{warning['source_file']}`")
-                    if warning.get('target_file'):
-                        lines.append(f"  - Target: `{warning['target_file']}`")
-            else:  # FAIL
-                lines.append(f"❌ **Status**: FAIL ({error_count} error(s))")
-                lines.append("")
-                lines.append("Critical errors detected. Cannot proceed with implementation:")
-                lines.append("")
-                for error in self.validation_result.get("errors", []):
-                    lines.append(f"- **[{error['category']}]** {error['message']}")
-                    lines.append(f"  - Source: `{error['source_file']}`")
-                    if error.get('target_file'):
-                        lines.append(f"  - Target: `{error['target_file']}`")
-        else:
-            lines.append("⚠️ Validation not run")
-
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Section 2: Execution Order
-        lines.append("## Execution Order")
-        lines.append("")
-        lines.append("Implementation should follow this dependency-ordered sequence:")
-        lines.append("")
-
+        header = (
+            f"# Unified Implementation Plan: {self.feature}\n"
+            "\n"
+            f"**Generated**: {generated}\n"
+            f"**Feature**: {self.feature}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+        return "".join([
+            header,
+            _TOC,
+            self._render_validation(),
+            self._render_execution(),
+            self._render_file_changes(),
+            self._render_integration(),
+            self._render_test_strategy(),
+            self._render_checkpoints(),
+            self._render_detailed_plans(),
+        ])
+
+    def _steps(self) -> List[Dict]:
+        """Execution plan steps, or an empty list if orchestration did not run."""
         if self.execution_plan and "steps" in self.execution_plan:
-            for step in self.execution_plan["steps"]:
-                step_num = step["step_number"]
-                agent = step["agent"]
-                desc = step["description"]
-                deps = step.get("dependencies", [])
-
-                lines.append(f"### Step {step_num}: {agent}")
-                lines.append("")
-                lines.append(f"**Description**: {desc}")
-                lines.append("")
-                lines.append(f"**Plan File**: `{step['plan_file']}`")
-                lines.append("")
-
-                if deps:
-                    lines.append(f"**Dependencies**: {', '.join(deps)}")
-                else:
-                    lines.append("**Dependencies**: None")
-
-                lines.append("")
-                lines.append(f"**Checkpoint**: {step['checkpoint']}")
-                lines.append("")
-        else:
-            lines.append("No execution plan available.")
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-        # Section 3: File Changes Summary
-        lines.append("## File Changes Summary")
-        lines.append("")
-        lines.append("Estimated files to create or modify:")
-        lines.append("")
-
+            return self.execution_plan["steps"]
+        return []
+
+    def _render_validation(self) -> str:
+        """Section 1: Validation Status."""
+        if not self.validation_result:
+            return _NO_VALIDATION
+
+        status = self.validation_result.get("status", "UNKNOWN")
+
+        if status == "PASS":
+            body = (
+                "✅ **Status**: PASS\n"
+                "\n"
+                "All plans are coherent and ready for implementation.\n"
+            )
+        elif status == "WARNINGS":
+            warning_count = self.validation_result.get("warning_count", 0)
+            body = (
+                f"⚠️ **Status**: WARNINGS ({warning_count} warning(s))\n"
+                "\n"
+                "Plans have warnings. Review recommended before implementation:\n"
+                "\n"
+                + self._render_issues(self.validation_result.get("warnings", []))
+            )
+        else:  # FAIL
+            error_count = self.validation_result.get("error_count", 0)
+            body = (
+                f"❌ **Status**: FAIL ({error_count} error(s))\n"
+                "\n"
+                "Critical errors detected. Cannot proceed with implementation:\n"
+                "\n"
+                + self._render_issues(self.validation_result.get("errors", []))
+            )
+
+        return f"## Validation Status\n\n{body}\n---\n\n"
+
+    def _render_execution(self) -> str:
+        """Section 2: Execution Order."""
+        if not (self.execution_plan and "steps" in self.execution_plan):
+            return _NO_EXECUTION
+
+        steps = "".join(
+            f"### Step {step['step_number']}: {step['agent']}\n"
+            "\n"
+            f"**Description**: {step['description']}\n"
+            "\n"
+            f"**Plan File**: `{step['plan_file']}`\n"
+            "\n"
+            f"**Dependencies**: {', '.join(step.get('dependencies', [])) or 'None'}\n"
+            "\n"
+            f"**Checkpoint**: {step['checkpoint']}\n"
+            "\n"
+            for step in self._steps()
+        )
+        return _EXECUTION_HEADER + steps + "---\n\n"
+
+    def _render_file_changes(self) -> str:
+        """Section 3: File Changes Summary."""
         # Extract file references from all plans
-        file_changes = self._extract_file_changes()
-
-        for category, files in file_changes.items():
-            if files:
-                lines.append(f"### {category}")
-                lines.append("")
-                for file in sorted(files):
-                    lines.append(f"- `{file}`")
-                lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-        # Section 4: Cross-Layer Integration
-        lines.append("## Cross-Layer Integration")
-        lines.append("")
-        lines.append("Key integration points between architectural layers:")
-        lines.append("")
-
-        if "database" in self.plans and "api_contract" in self.plans:
-            lines.append("### Database ↔ API Contract")
-            lines.append("")
-            lines.append("- Database schemas map to API request/response models")
-            lines.append("- Field naming conventions should align (snake_case in DB, camelCase in API)")
-            lines.append("- Data type compatibility validated")
-            lines.append("")
-
-        if "api_contract" in self.plans and "backend" in self.plans:
-            lines.append("### API Contract ↔ Backend")
-            lines.append("")
-            lines.append("- Each API endpoint has corresponding backend handler")
-            lines.append("- Request/response schemas match backend data transformations")
-            lines.append("- Error codes defined in API are handled in backend")
-            lines.append("")
-
-        if "backend" in self.plans and "frontend" in self.plans:
-            lines.append("### Backend ↔ Frontend")
-            lines.append("")
-            lines.append("- Frontend API client calls match backend endpoints")
-            lines.append("- State management aligns with API response structures")
-            lines.append("- Error handling covers all API error responses")
-            lines.append("")
-
-        if "frontend" in self.plans and "ui_components" in self.plans:
-            lines.append("### Frontend ↔ UI Components")
-            lines.append("")
-            lines.append("- All UI components referenced in frontend are defined")
-            lines.append("- Component props match frontend data structures")
-            lines.append("- Design system conventions are consistent")
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-        # Section 5: Test Strategy
-        lines.append("## Test Strategy")
-        lines.append("")
-        lines.append("Comprehensive testing approach across all layers:")
-        lines.append("")
-
-        test_strategy = {
-            "database": [
-                "Run migrations on test database",
-                "Verify schema integrity",
-                "Test database constraints and indexes"
-            ],
-            "api_contract": [
-                "Validate OpenAPI/GraphQL schema syntax",
-                "Run contract tests (Pact, Postman)",
-                "Test API documentation accuracy"
-            ],
-            "backend": [
-                "Unit tests for business logic",
-                "Integration tests for API endpoints",
-                "Test error handling and edge cases"
-            ],
-            "frontend": [
-                "Integration tests for API calls",
-                "State management tests",
-                "End-to-end tests (Playwright/Cypress)"
-            ],
-            "ui_components": [
-                "Component unit tests",
-                "Visual regression tests",
-                "Accessibility tests (WCAG compliance)"
-            ]
-        }
-
-        for layer, tests in test_strategy.items():
-            if layer in self.plans:
-                layer_name = layer.replace("_", " ").title()
-                lines.append(f"### {layer_name} Tests")
-                lines.append("")
-                for test in tests:
-                    lines.append(f"- {test}")
-                lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-        # Section 6: Implementation Checkpoints
-        lines.append("## Implementation Checkpoints")
-        lines.append("")
-        lines.append("Verify these checkpoints after each implementation step:")
-        lines.append("")
-
-        if self.execution_plan and "steps" in self.execution_plan:
-            for step in self.execution_plan["steps"]:
-                step_num = step["step_number"]
-                checkpoint = step["checkpoint"]
-                lines.append(f"{step_num}. **After {step['agent']}**: {checkpoint}")
-
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Section 7: Detailed Plans
-        lines.append("## Detailed Plans")
-        lines.append("")
-        lines.append("Full agent plans for reference:")
-        lines.append("")
-
-        for plan_type, content in self.plans.items():
-            plan_name = plan_type.replace("_", " ").title()
-            lines.append(f"### {plan_name}")
-            lines.append("")
-            lines.append(f"See: `.claude/doc/{self.feature}/{plan_type}.md`")
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-        lines.append(f"**End of Unified Implementation Plan for {self.feature}**")
-
-        return "\n".join(lines)
+        categories = "".join(
+            f"### {category}\n\n" + "".join(f"- `{file}`\n" for file in files) + "\n"
+            for category, files in self._extract_file_changes().items()
+            if files
+        )
+        return (
+            "## File Changes Summary\n"
+            "\n"
+            "Estimated files to create or modify:\n"
+            "\n"
+            f"{categories}"
+            "---\n"
+            "\n"
+        )
+
+    def _render_integration(self) -> str:
+        """Section 4: Cross-Layer Integration."""
+        blocks = "".join(
+            block
+            for (source, target), block in _INTEGRATION_POINTS
+            if source in self.plans and target in self.plans
+        )
+        return (
+            "## Cross-Layer Integration\n"
+            "\n"
+            "Key integration points between architectural layers:\n"
+            "\n"
+            f"{blocks}"
+            "---\n"
+            "\n"
+        )
+
+    def _render_test_strategy(self) -> str:
+        """Section 5: Test Strategy."""
+        blocks = "".join(
+            block for layer, block in _TEST_STRATEGY_SECTIONS if layer in self.plans
+        )
+        return (
+            "## Test Strategy\n"
+            "\n"
+            "Comprehensive testing approach across all layers:\n"
+            "\n"
+            f"{blocks}"
+            "---\n"
+            "\n"
+        )
+
+    def _render_checkpoints(self) -> str:
+        """Section 6: Implementation Checkpoints."""
+        steps = self._steps()
+        if not steps:
+            return _NO_CHECKPOINTS
+
+        checkpoints = "".join(
+            f"{step['step_number']}. **After {step['agent']}**: {step['checkpoint']}\n"
+            for step in steps
+        )
+        return _CHECKPOINTS_HEADER + checkpoints + "\n---\n\n"
+
+    def _render_detailed_plans(self) -> str:
+        """Section 7: Detailed Plans."""
+        plans = "".join(
+            f"### {plan_type.replace('_', ' ').title()}\n"
+            "\n"
+            f"See: `.claude/doc/{self.feature}/{plan_type}.md`\n"
+            "\n"
+            for plan_type in self.plans
+        )
+        return (
+            "## Detailed Plans\n"
+            "\n"
+            "Full agent plans for reference:\n"
+            "\n"
+            f"{plans}"
+            "---\n"
+            "\n"
+            f"**End of Unified Implementation Plan for {self.feature}**"
+        )
+
+    @staticmethod
+    def _render_issues(issues: List[Dict]) -> str:
+        """Render validation warnings or errors as a markdown list."""
+        return "".join(
+            f"- **[{issue['category']}]** {issue['message']}\n"
+            f"  - Source: `{issue['source_file']}`\n"
+            + (f"  - Target: `{issue['target_file']}`\n" if issue.get('target_file') else "")
+            for issue in issues
+        )
 
     def _extract_file_changes(self) -> Dict[str, List[str]]:
         """Extract file references from all plans."""
-        file_changes = {
-            "Database Migrations": [],
-            "Backend Files": [],
-            "Frontend Files": [],
-            "UI Components": [],
-            "Tests": [],
-            "Configuration": []
-        }
+        file_changes: Dict[str, Set[str]] = {category: set() for category in FILE_CATEGORIES}
 
         # Simple pattern matching to extract file references
         # This is a basic implementation - can be enhanced with more sophisticated parsing
 
         for plan_type, content in self.plans.items():
             # Look for file paths in backticks or code blocks
-            import re
-            file_pattern = r'`([a-zA-Z0-9_/\-\.]+\.(ts|js|tsx|jsx|py|sql|yml|yaml|json|md))`'
-            matches = re.findall(file_pattern, content)
-
-            for file_path, ext in matches:
-                if "migration" in file_path.lower() or ext == "sql":
-                    file_changes["Database Migrations"].append(file_path)
-                elif "test" in file_path.lower() or "spec" in file_path.lower():
-                    file_changes["Tests"].append(file_path)
-                elif "component" in file_path.lower() or plan_type == "ui_components":
-                    file_changes["UI Components"].append(file_path)
-                elif ext in ["yml", "yaml", "json"] and "config" in file_path.lower():
-                    file_changes["Configuration"].append(file_path)
-                elif plan_type in ["backend", "domain_logic"]:
-                    file_changes["Backend Files"].append(file_path)
-                elif plan_type in ["frontend", "presentation"]:
-                    file_changes["Frontend Files"].append(file_path)
-
-        # Remove duplicates
-        for category in file_changes:
-            file_changes[category] = list(set(file_changes[category]))
-
-        return file_changes
+            for match in FILE_RE.finditer(content):
+                file_path, ext = match.groups()
+                category = _classify(file_path.lower(), ext, plan_type)
+                if category:
+                    file_changes[category].add(file_path)
+
+        return {category: sorted(files) for category, files in file_changes.items()}
 
 
 def main():
@@ -395,16 +482,15 @@ def main():
     # Generate unified plan
     generator = UnifiedPlanGenerator(args.feature, plans_dir)
 
-    print("Loading agent plans...")
+    out = sys.stdout
+    out.write("Loading agent plans...\n")
     generator.load_plans()
 
-    print("Running validation...")
-    generator.run_validation()
-
-    print("Running orchestration...")
-    generator.run_orchestration()
+    out.write("Running validation and orchestration...\n")
+    out.flush()
+    generator.run_validation_and_orchestration()
 
-    print("Generating unified plan...")
+    out.write("Generating unified plan...\n")
     unified_plan = generator.generate_unified_plan()
 
     # Write output
@@ -414,7 +500,8 @@ def main():
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(unified_plan)
 
-    print(f"\n✅ Unified implementation plan generated: {output_path}")
+    out.write(f"\n✅ Unified implementation plan generated: {output_path}\n")
+    out.flush()
 
     return 0
 
@@ -10,13 +10,34 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 
-@dataclass
+try:
+    import orjson
+
+    def _jdumps(obj) -> bytes:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        # orjson cannot escape non-ASCII text; defer to json so the bytes match json.dump
+        return data if data.isascii() else json.dumps(obj, indent=2).encode("ascii")
+except ImportError:  # orjson is optional; fall back to stdlib json
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("ascii")
+
+# Plan files the orchestrator knows how to schedule
+_PLAN_FILES = ("database.md", "api_contract.md", "backend.md", "frontend.md", "ui_components.md")
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class AgentTask:
     """Represents a task to be executed by an agent."""
     agent_name: str
@@ -26,7 +47,7 @@ class AgentTask:
     checkpoint: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExecutionPlan:
     """Execution plan with ordered agent tasks."""
     steps: List[AgentTask] = field(default_factory=list)
@@ -37,21 +58,31 @@ class ExecutionPlan:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        steps = self.steps
         return {
             "steps": [
                 {
-                    "step_number": idx + 1,
+                    "step_number": idx,
                     "agent": task.agent_name,
                     "plan_file": task.plan_file,
                     "dependencies": task.dependencies,
                     "description": task.description,
                     "checkpoint": task.checkpoint
                 }
-                for idx, task in enumerate(self.steps)
+                for idx, task in enumerate(steps, 1)
             ]
         }
 
 
+def _reverse_graph(graph: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Invert agent → dependencies into dependency → dependent agents."""
+    reverse: Dict[str, List[str]] = {}
+    for agent, deps in graph.items():
+        for dep in deps:
+            reverse.setdefault(dep, []).append(agent)
+    return reverse
+
+
 class AgentOrchestrator:
     """Orchestrates agent execution based on dependency graph."""
 
@@ -64,6 +95,10 @@ class AgentOrchestrator:
         "ui-component-architect": ["presentation-layer-architect"],
     }
 
+    # Derived once from DEPENDENCY_GRAPH for the topological sort
+    _INITIAL_IN_DEGREE = {agent: len(deps) for agent, deps in DEPENDENCY_GRAPH.items()}
+    _REVERSE_DEPS = _reverse_graph(DEPENDENCY_GRAPH)
+
     # Mapping: plan file → agent name
     PLAN_TO_AGENT = {
         "database.md": "database-architect",
@@ -73,6 +108,9 @@ class AgentOrchestrator:
         "ui_components.md": "ui-component-architect",
     }
 
+    # Mapping: agent name → plan file
+    AGENT_TO_PLAN = {agent: plan_file for plan_file, agent in PLAN_TO_AGENT.items()}
+
     # Agent descriptions and checkpoints
     AGENT_INFO = {
         "database-architect": {
@@ -104,16 +142,27 @@ class AgentOrchestrator:
 
     def _detect_plans(self):
         """Detect which agent plans exist."""
-        for plan_file in self.PLAN_TO_AGENT.keys():
-            if (self.plans_dir / plan_file).exists():
-                self.available_plans.add(plan_file)
+        # One directory read instead of a stat() per candidate plan
+        try:
+            with os.scandir(self.plans_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            return
+
+        self.available_plans.update(
+            plan_file for plan_file in _PLAN_FILES if plan_file in existing
+        )
 
     def generate_execution_plan(self) -> ExecutionPlan:
         """Generate execution plan based on available plans and dependencies."""
         execution_plan = ExecutionPlan()
+        if not self.available_plans:
+            return execution_plan
 
-        # Topological sort to determine execution order
-        ordered_agents = self._topological_sort()
+        # Topological sort to determine execution order, limited to the agents
+        # with a plan and the agents they transitively depend on
+        relevant = {self.PLAN_TO_AGENT[plan_file] for plan_file in self.available_plans}
+        ordered_agents = self._topological_sort(self._with_ancestors(relevant))
 
         # Build execution steps
         for agent_name in ordered_agents:
@@ -131,62 +180,71 @@ class AgentOrchestrator:
 
         return execution_plan
 
-    def _topological_sort(self) -> List[str]:
-        """Perform topological sort on dependency graph."""
-        # Build in-degree map
-        in_degree = {agent: 0 for agent in self.DEPENDENCY_GRAPH.keys()}
-        for agent, deps in self.DEPENDENCY_GRAPH.items():
-            for dep in deps:
-                in_degree[agent] += 1
-
-        # Find agents with no dependencies
+    def _with_ancestors(self, agents: Set[str]) -> Set[str]:
+        """Close a set of agents over their transitive dependencies."""
+        closed = set(agents)
+        pending = list(agents)
+        while pending:
+            for dep in self.DEPENDENCY_GRAPH.get(pending.pop(), ()):
+                if dep not in closed:
+                    closed.add(dep)
+                    pending.append(dep)
+        return closed
+
+    def _topological_sort(self, agents: Optional[Set[str]] = None) -> List[str]:
+        """Perform topological sort on dependency graph, or on a dependency-closed subset of it."""
+        if agents is None:
+            in_degree = dict(self._INITIAL_IN_DEGREE)
+        else:
+            in_degree = {
+                agent: degree
+                for agent, degree in self._INITIAL_IN_DEGREE.items()
+                if agent in agents
+            }
+
+        # Find agents with no dependencies; the heap keeps ordering consistent
+        # when multiple agents have same priority
         queue = [agent for agent, degree in in_degree.items() if degree == 0]
+        heapq.heapify(queue)
         result = []
 
         while queue:
-            # Sort to ensure consistent ordering when multiple agents have same priority
-            queue.sort()
-            current = queue.pop(0)
+            current = heapq.heappop(queue)
             result.append(current)
 
             # Reduce in-degree for dependent agents
-            for agent, deps in self.DEPENDENCY_GRAPH.items():
-                if current in deps:
-                    in_degree[agent] -= 1
-                    if in_degree[agent] == 0:
-                        queue.append(agent)
+            for agent in self._REVERSE_DEPS.get(current, ()):
+                if agent not in in_degree:
+                    continue
+                in_degree[agent] -= 1
+                if in_degree[agent] == 0:
+                    heapq.heappush(queue, agent)
 
         return result
 
     def _agent_to_plan(self, agent_name: str) -> Optional[str]:
         """Convert agent name to plan file."""
-        for plan_file, agent in self.PLAN_TO_AGENT.items():
-            if agent == agent_name:
-                return plan_file
-        return None
+        return self.AGENT_TO_PLAN.get(agent_name)
 
     def print_execution_plan(self, plan: ExecutionPlan):
         """Print execution plan in human-readable format."""
-        print(f"\n{'='*60}")
-        print(f"Agent Execution Plan")
-        print(f"{'='*60}\n")
+        parts = [
+            f"\n{'='*60}",
+            "Agent Execution Plan",
+            f"{'='*60}\n",
+        ]
 
         for idx, task in enumerate(plan.steps, 1):
-            print(f"Step {idx}: {task.agent_name}")
-            print(f"  Plan: {task.plan_file}")
-            print(f"  Description: {task.description}")
-
-            if task.dependencies:
-                deps_str = ", ".join(task.dependencies)
-                print(f"  Dependencies: {deps_str}")
-            else:
-                print(f"  Dependencies: None")
-
-            print(f"  Checkpoint: {task.checkpoint}")
-            print()
+            parts.append(f"Step {idx}: {task.agent_name}")
+            parts.append(f"  Plan: {task.plan_file}")
+            parts.append(f"  Description: {task.description}")
+            parts.append(f"  Dependencies: {', '.join(task.dependencies) or 'None'}")
+            parts.append(f"  Checkpoint: {task.checkpoint}")
+            parts.append("")
 
-        print(f"Total steps: {len(plan.steps)}")
-        print(f"{'='*60}\n")
+        parts.append(f"Total steps: {len(plan.steps)}")
+        parts.append(f"{'='*60}\n")
+        sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():
@@ -214,8 +272,8 @@ def main():
         plan_dict = execution_plan.to_dict()
         plan_dict["feature"] = args.feature
 
-        with open(args.output, 'w') as f:
-            json.dump(plan_dict, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_jdumps(plan_dict))
 
         print(f"Execution plan saved to: {args.output}")
 
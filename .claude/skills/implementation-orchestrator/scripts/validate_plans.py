@@ -10,15 +10,97 @@ Usage:
 """
 
 import argparse
+import bisect
+import functools
+import itertools
 import json
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 
-@dataclass
+try:
+    import orjson
+
+    def _jdumps(obj) -> bytes:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        # orjson cannot escape non-ASCII text; defer to json so the bytes match json.dump
+        return data if data.isascii() else json.dumps(obj, indent=2).encode("ascii")
+except ImportError:  # orjson is optional; fall back to stdlib json
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("ascii")
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; endpoints fall back to the regex scan
+    ahocorasick = None
+
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+
+def _build_method_automaton():
+    """Automaton over every spelling re.IGNORECASE accepts for the HTTP methods."""
+    automaton = ahocorasick.Automaton()
+    for method in HTTP_METHODS:
+        # "ſ" (U+017F) is the one non-ASCII letter IGNORECASE folds onto these
+        spellings = [{c, c.lower(), "ſ"} if c == "S" else {c, c.lower()} for c in method]
+        for variant in itertools.product(*spellings):
+            automaton.add_word("".join(variant), method)
+    automaton.make_automaton()
+    return automaton
+
+
+_METHOD_AUTOMATON = _build_method_automaton() if ahocorasick is not None else None
+
+
+def _fuse(*patterns: Tuple[str, str], flags: int = 0):
+    """Combine (name, pattern) pairs into one regex for _fused_findall.
+
+    Each pattern needs exactly one capturing group, and no two patterns may
+    match at the same position. The alternation sits inside a lookahead so
+    the scan stays zero-width and overlapping matches of different patterns
+    are all seen.
+    """
+    alternatives = "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns)
+    return re.compile(f"(?={alternatives})", flags)
+
+
+def _fused_findall(fused, content: str) -> List[Tuple[str, str]]:
+    """(pattern name, captured group) for each match, in text order.
+
+    Yields the same matches as running each component pattern's own
+    finditer, in a single pass over the text.
+    """
+    found = []
+    resume_at: Dict[str, int] = {}
+    for match in fused.finditer(content):
+        name = match.lastgroup
+        if match.start() < resume_at.get(name, 0):
+            continue  # overlaps this pattern's previous match
+        resume_at[name] = match.end(name)
+        found.append((name, match.group(match.lastindex + 1)))
+    return found
+
+
+# (plan type, plan file), in validation order
+_PLAN_FILES = (
+    ("database", "database.md"),
+    ("api_contract", "api_contract.md"),
+    ("backend", "backend.md"),
+    ("frontend", "frontend.md"),
+    ("ui_components", "ui_components.md"),
+)
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ValidationIssue:
     """Represents a validation issue (warning or error)."""
     severity: str  # "warning" or "error"
@@ -29,64 +111,154 @@ class ValidationIssue:
     line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Results of plan validation."""
     status: str  # "PASS", "WARNINGS", "FAIL"
     issues: List[ValidationIssue] = field(default_factory=list)
+    _errors: List[ValidationIssue] = field(default_factory=list, init=False, repr=False)
+    _warnings: List[ValidationIssue] = field(default_factory=list, init=False, repr=False)
+
+    def add(self, issue: ValidationIssue):
+        """Record an issue, bucketing it by severity."""
+        self.issues.append(issue)
+        if issue.severity == "error":
+            self._errors.append(issue)
+        elif issue.severity == "warning":
+            self._warnings.append(issue)
 
     @property
     def errors(self) -> List[ValidationIssue]:
-        return [i for i in self.issues if i.severity == "error"]
+        return self._errors
 
     @property
     def warnings(self) -> List[ValidationIssue]:
-        return [i for i in self.issues if i.severity == "warning"]
+        return self._warnings
 
 
 class PlanValidator:
     """Validates coherence across multiple agent plans."""
 
+    # Type compatibility mapping: DB type → lowercased compatible API types
+    _COMPAT: Dict[str, FrozenSet[str]] = {
+        "UUID": frozenset({"string"}),
+        "VARCHAR": frozenset({"string"}),
+        "TEXT": frozenset({"string"}),
+        "INTEGER": frozenset({"integer", "number", "int"}),
+        "INT": frozenset({"integer", "number", "int"}),
+        "BIGINT": frozenset({"integer", "number", "int"}),
+        "BOOLEAN": frozenset({"boolean", "bool"}),
+        "TIMESTAMP": frozenset({"string", "date-time", "datetime"}),
+        "DATE": frozenset({"string", "date"}),
+        "JSON": frozenset({"object"}),
+        "JSONB": frozenset({"object"}),
+    }
+
+    # Plan extraction patterns, compiled once at class load
+    #
+    # Header/field lines are matched in one pass over the whole text: each match
+    # is the first header on a line, else the first field on it. [^\S\n] keeps
+    # whitespace runs from spanning lines.
+    _DB_LINE_RE = re.compile(
+        r"^(?:.*?(?i:###?[^\S\n]+Table:[^\S\n]+(?P<table>\w+)"
+        r"|###?[^\S\n]+(?P<table_alt>\w+)[^\S\n]+table)"
+        r"|.*?[-*][^\S\n]+(?P<field>\w+):[^\S\n]+(?P<type>\w+))",
+        re.MULTILINE,
+    )
+    _API_LINE_RE = re.compile(
+        r"^(?:.*?(?P<schema>\w+)(?:Schema|Request|Response):"
+        r"|.*?(?P<field>\w+):[^\S\n]*(?:type:[^\S\n]*)?(?P<type>\w+))",
+        re.MULTILINE,
+    )
+    _ENDPOINT_RE = re.compile(r"(GET|POST|PUT|PATCH|DELETE)\s+(/[\w/\-{}]+)", re.IGNORECASE)
+    _ENDPOINT_PATH_RE = re.compile(r"\s+(/[\w/\-{}]+)")
+    _HANDLER_RE = _fuse(
+        ("def", r"def\s+(\w+)"),  # Python functions
+        ("async_def", r"async\s+def\s+(\w+)"),  # Python async functions
+        ("function", r"function\s+(\w+)"),  # JavaScript functions
+        ("const", r"const\s+(\w+)\s*="),  # JavaScript const
+        ("router", r"router\.(get|post|put|patch|delete)\s*\("),  # Express routes
+        flags=re.IGNORECASE,
+    )
+    _ROUTE_RE = re.compile(r"@app\.(?:route|get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]")
+    _API_CALL_RE = _fuse(
+        ("fetch", r"fetch\s*\(['\"]([^'\"]+)['\"]"),
+        ("axios", r"axios\.(?:get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]"),
+        ("api", r"api\.(?:get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]"),
+    )
+    _COMPONENT_USAGE_RE = _fuse(
+        ("jsx", r"<(\w+)\s+"),  # JSX components
+        ("import", r"import\s+\{\s*(\w+)\s*\}"),  # Import statements
+        ("hook", r"const\s+(\w+)\s*=.*useComponent"),  # Component hooks
+    )
+    _COMPONENT_DEF_RE = _fuse(
+        ("heading", r"##\s+(\w+)\s+Component"),
+        ("export", r"export\s+(?:function|const)\s+(\w+)"),
+        ("class", r"class\s+(\w+)\s+extends"),
+    )
+
     def __init__(self, plans_dir: Path):
         self.plans_dir = plans_dir
         self.plans: Dict[str, str] = {}
+        # Extraction results per plan, so each plan is parsed once across validators
+        self._parsed: Dict[str, tuple] = {}
         self._load_plans()
 
     def _load_plans(self):
         """Load all available plan files."""
-        plan_files = {
-            "database": "database.md",
-            "api_contract": "api_contract.md",
-            "backend": "backend.md",
-            "frontend": "frontend.md",
-            "ui_components": "ui_components.md"
-        }
-
-        for plan_type, filename in plan_files.items():
-            filepath = self.plans_dir / filename
-            if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self.plans[plan_type] = f.read()
+        # One directory read instead of a stat() per candidate plan
+        try:
+            with os.scandir(self.plans_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+
+        plans_dir_str = str(self.plans_dir)
+        for plan_type, filename in _PLAN_FILES:
+            if filename in existing:
+                self.plans[plan_type] = self._read_plan(os.path.join(plans_dir_str, filename))
+
+    @staticmethod
+    def _read_plan(path: str) -> str:
+        """Read a plan file, decoding straight from a memory map of it."""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8')
+        # Match text-mode universal newline handling
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
 
     def validate(self) -> ValidationResult:
         """Run all validation checks."""
         result = ValidationResult(status="PASS")
 
-        # Validate database ↔ API contract
-        if "database" in self.plans and "api_contract" in self.plans:
-            result.issues.extend(self._validate_db_api())
-
-        # Validate API contract ↔ backend
-        if "api_contract" in self.plans and "backend" in self.plans:
-            result.issues.extend(self._validate_api_backend())
+        # Pairwise checks, each run only when both of its plans are present
+        checks = [
+            check
+            for source, target, check in (
+                ("database", "api_contract", self._validate_db_api),  # database ↔ API contract
+                ("api_contract", "backend", self._validate_api_backend),  # API contract ↔ backend
+                ("backend", "frontend", self._validate_backend_frontend),  # backend ↔ frontend
+                ("frontend", "ui_components", self._validate_frontend_ui),  # frontend ↔ UI components
+            )
+            if source in self.plans and target in self.plans
+        ]
 
-        # Validate backend ↔ frontend
-        if "backend" in self.plans and "frontend" in self.plans:
-            result.issues.extend(self._validate_backend_frontend())
+        if checks:
+            # Fill the shared parse cache before the checks run concurrently
+            self._parse_api_contract()
+            self._parse_backend()
 
-        # Validate frontend ↔ UI components
-        if "frontend" in self.plans and "ui_components" in self.plans:
-            result.issues.extend(self._validate_frontend_ui())
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = [executor.submit(check) for check in checks]
+                # Collect in submission order so the issue order is stable
+                for future in futures:
+                    for issue in future.result():
+                        result.add(issue)
 
         # Determine overall status
         if result.errors:
@@ -106,7 +278,7 @@ class PlanValidator:
         db_fields = self._extract_db_fields(self.plans["database"])
 
         # Extract API schemas
-        api_fields = self._extract_api_fields(self.plans["api_contract"])
+        api_fields, _ = self._parse_api_contract()
 
         # Check naming conventions
         for table, fields in db_fields.items():
@@ -145,16 +317,20 @@ class PlanValidator:
         issues = []
 
         # Extract API endpoints
-        api_endpoints = self._extract_api_endpoints(self.plans["api_contract"])
+        _, api_endpoints = self._parse_api_contract()
 
         # Extract backend handlers/routes
-        backend_handlers = self._extract_backend_handlers(self.plans["backend"])
+        backend_handlers, _ = self._parse_backend()
+        handler_set = set(backend_handlers)
 
-        # Check if all API endpoints have backend handlers
+        # Check if all API endpoints have backend handlers (exact name first,
+        # then substring match against the distinct handler names)
         for endpoint, method in api_endpoints:
             handler_pattern = self._endpoint_to_handler(endpoint, method)
 
-            if not any(handler_pattern in handler for handler in backend_handlers):
+            if handler_pattern not in handler_set and not any(
+                handler_pattern in handler for handler in handler_set
+            ):
                 issues.append(ValidationIssue(
                     severity="error",
                     category="integration",
@@ -170,17 +346,18 @@ class PlanValidator:
         issues = []
 
         # Extract API endpoints from backend
-        api_endpoints = self._extract_api_endpoints(self.plans.get("api_contract", ""))
+        _, api_endpoints = self._parse_api_contract()
         if not api_endpoints:
             # Try extracting from backend if API contract not available
-            api_endpoints = self._extract_backend_routes(self.plans["backend"])
+            _, api_endpoints = self._parse_backend()
 
         # Extract frontend API calls
         frontend_calls = self._extract_frontend_api_calls(self.plans["frontend"])
 
         # Check if frontend calls non-existent APIs
+        endpoint_paths = sorted({endpoint for endpoint, _ in api_endpoints})
         for call in frontend_calls:
-            if not any(call in endpoint for endpoint, _ in api_endpoints):
+            if not self._call_matches_endpoint(call, endpoint_paths):
                 issues.append(ValidationIssue(
                     severity="warning",
                     category="integration",
@@ -216,27 +393,36 @@ class PlanValidator:
 
     # Helper extraction methods
 
+    def _parse_api_contract(self) -> Tuple[Dict[str, Dict[str, str]], List[Tuple[str, str]]]:
+        """Extract (schemas, endpoints) from api_contract.md, once per validator."""
+        parsed = self._parsed.get("api_contract")
+        if parsed is None:
+            content = self.plans.get("api_contract", "")
+            parsed = (self._extract_api_fields(content), self._extract_api_endpoints(content))
+            self._parsed["api_contract"] = parsed
+        return parsed
+
+    def _parse_backend(self) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Extract (handlers, routes) from backend.md, once per validator."""
+        parsed = self._parsed.get("backend")
+        if parsed is None:
+            content = self.plans.get("backend", "")
+            parsed = (self._extract_backend_handlers(content), self._extract_backend_routes(content))
+            self._parsed["backend"] = parsed
+        return parsed
+
     def _extract_db_fields(self, content: str) -> Dict[str, Dict[str, str]]:
         """Extract database fields from database.md."""
         tables = {}
         current_table = None
 
-        # Simple regex to extract table and field definitions
-        table_pattern = r"###?\s+Table:\s+(\w+)|###?\s+(\w+)\s+table"
-        field_pattern = r"[-*]\s+(\w+):\s+(\w+)"
-
-        for line in content.split('\n'):
-            table_match = re.search(table_pattern, line, re.IGNORECASE)
-            if table_match:
-                current_table = table_match.group(1) or table_match.group(2)
+        for match in self._DB_LINE_RE.finditer(content):
+            table = match.group("table") or match.group("table_alt")
+            if table:
+                current_table = table
                 tables[current_table] = {}
-                continue
-
-            if current_table:
-                field_match = re.search(field_pattern, line)
-                if field_match:
-                    field_name, field_type = field_match.groups()
-                    tables[current_table][field_name] = field_type.upper()
+            elif current_table:
+                tables[current_table][match.group("field")] = match.group("type").upper()
 
         return tables
 
@@ -246,21 +432,13 @@ class PlanValidator:
         current_schema = None
 
         # Extract from OpenAPI YAML or JSON schema definitions
-        schema_pattern = r"(\w+)(?:Schema|Request|Response):"
-        field_pattern = r"(\w+):\s*(?:type:\s*)?(\w+)"
-
-        for line in content.split('\n'):
-            schema_match = re.search(schema_pattern, line)
-            if schema_match:
-                current_schema = schema_match.group(1)
+        for match in self._API_LINE_RE.finditer(content):
+            schema = match.group("schema")
+            if schema:
+                current_schema = schema
                 schemas[current_schema] = {}
-                continue
-
-            if current_schema:
-                field_match = re.search(field_pattern, line)
-                if field_match:
-                    field_name, field_type = field_match.groups()
-                    schemas[current_schema][field_name] = field_type
+            elif current_schema:
+                schemas[current_schema][match.group("field")] = match.group("type")
 
         return schemas
 
@@ -269,40 +447,38 @@ class PlanValidator:
         endpoints = []
 
         # Match patterns like "GET /users", "POST /auth/login"
-        endpoint_pattern = r"(GET|POST|PUT|PATCH|DELETE)\s+(/[\w/\-{}]+)"
-
-        for match in re.finditer(endpoint_pattern, content, re.IGNORECASE):
-            method, path = match.groups()
-            endpoints.append((path, method.upper()))
+        if _METHOD_AUTOMATON is None:
+            for match in self._ENDPOINT_RE.finditer(content):
+                method, path = match.groups()
+                endpoints.append((path, method.upper()))
+            return endpoints
+
+        # Locate method keywords in one automaton pass, then parse the path
+        # after each; skipping keywords inside the previous match mirrors
+        # finditer's non-overlapping scan
+        path_match = self._ENDPOINT_PATH_RE.match
+        scanned_to = 0
+        for end, method in _METHOD_AUTOMATON.iter(content):
+            if end - len(method) + 1 < scanned_to:
+                continue
+            match = path_match(content, end + 1)
+            if match:
+                endpoints.append((match.group(1), method))
+                scanned_to = match.end()
 
         return endpoints
 
     def _extract_backend_handlers(self, content: str) -> List[str]:
         """Extract backend handler names."""
-        handlers = []
-
         # Match handler/route definitions
-        handler_patterns = [
-            r"def\s+(\w+)",  # Python functions
-            r"async\s+def\s+(\w+)",  # Python async functions
-            r"function\s+(\w+)",  # JavaScript functions
-            r"const\s+(\w+)\s*=",  # JavaScript const
-            r"router\.(get|post|put|patch|delete)\s*\(",  # Express routes
-        ]
-
-        for pattern in handler_patterns:
-            handlers.extend(re.findall(pattern, content, re.IGNORECASE))
-
-        return handlers
+        return [name for _, name in _fused_findall(self._HANDLER_RE, content)]
 
     def _extract_backend_routes(self, content: str) -> List[Tuple[str, str]]:
         """Extract backend routes."""
         routes = []
 
         # Similar to API endpoints
-        route_pattern = r"@app\.(?:route|get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]"
-
-        for match in re.finditer(route_pattern, content):
+        for match in self._ROUTE_RE.finditer(content):
             path = match.group(1)
             routes.append((path, ""))
 
@@ -310,57 +486,35 @@ class PlanValidator:
 
     def _extract_frontend_api_calls(self, content: str) -> List[str]:
         """Extract API calls from frontend plan."""
-        calls = []
-
-        # Match fetch/axios/api client calls
-        call_patterns = [
-            r"fetch\s*\(['\"]([^'\"]+)['\"]",
-            r"axios\.(get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]",
-            r"api\.(get|post|put|patch|delete)\s*\(['\"]([^'\"]+)['\"]",
-        ]
-
-        for pattern in call_patterns:
-            for match in re.finditer(pattern, content):
-                # Extract the URL path (last group)
-                path = match.groups()[-1]
-                calls.append(path)
+        # Match fetch/axios/api client calls, grouped by client as before
+        calls_by_client = {client: [] for client in ("fetch", "axios", "api")}
+        for client, path in _fused_findall(self._API_CALL_RE, content):
+            calls_by_client[client].append(path)
 
-        return calls
+        return [path for paths in calls_by_client.values() for path in paths]
 
     def _extract_frontend_components(self, content: str) -> Set[str]:
         """Extract component references from frontend."""
-        components = set()
-
         # Match component usage patterns
-        component_patterns = [
-            r"<(\w+)\s+",  # JSX components
-            r"import\s+\{\s*(\w+)\s*\}",  # Import statements
-            r"const\s+(\w+)\s*=.*useComponent",  # Component hooks
-        ]
-
-        for pattern in component_patterns:
-            components.update(re.findall(pattern, content))
-
-        return components
+        return {name for _, name in _fused_findall(self._COMPONENT_USAGE_RE, content)}
 
     def _extract_ui_components(self, content: str) -> Set[str]:
         """Extract defined UI components."""
-        components = set()
-
         # Match component definitions
-        component_patterns = [
-            r"##\s+(\w+)\s+Component",
-            r"export\s+(?:function|const)\s+(\w+)",
-            r"class\s+(\w+)\s+extends",
-        ]
-
-        for pattern in component_patterns:
-            components.update(re.findall(pattern, content))
-
-        return components
+        return {name for _, name in _fused_findall(self._COMPONENT_DEF_RE, content)}
 
     # Helper utility methods
 
+    @staticmethod
+    def _call_matches_endpoint(call: str, endpoint_paths: List[str]) -> bool:
+        """Check whether call occurs in any of the sorted endpoint paths."""
+        # Exact and prefix matches sit at the bisection point; anything
+        # else falls back to a substring scan
+        idx = bisect.bisect_left(endpoint_paths, call)
+        if idx < len(endpoint_paths) and endpoint_paths[idx].startswith(call):
+            return True
+        return any(call in endpoint for endpoint in endpoint_paths)
+
     def _snake_to_camel(self, snake_str: str) -> str:
         """Convert snake_case to camelCase."""
         components = snake_str.split('_')
@@ -374,32 +528,46 @@ class PlanValidator:
         handler_name = method.lower() + ''.join(p.title() for p in parts)
         return handler_name
 
-    def _types_compatible(self, db_type: str, api_type: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _types_compatible(db_type: str, api_type: str) -> bool:
         """Check if database type and API type are compatible."""
-        # Type compatibility mapping
-        compatibility = {
-            "UUID": ["string", "String"],
-            "VARCHAR": ["string", "String"],
-            "TEXT": ["string", "String"],
-            "INTEGER": ["integer", "number", "int"],
-            "INT": ["integer", "number", "int"],
-            "BIGINT": ["integer", "number", "int"],
-            "BOOLEAN": ["boolean", "bool"],
-            "TIMESTAMP": ["string", "date-time", "DateTime"],
-            "DATE": ["string", "date", "Date"],
-            "JSON": ["object", "Object"],
-            "JSONB": ["object", "Object"],
-        }
-
+        # Cached per type pair: plans repeat a handful of types across many
+        # fields, so each pair is case-folded once. Extracted types keep
+        # their original case because issue messages quote them.
         db_type_upper = db_type.upper()
-        api_type_lower = api_type.lower()
 
-        if db_type_upper in compatibility:
-            return api_type_lower in [t.lower() for t in compatibility[db_type_upper]]
+        compatible = PlanValidator._COMPAT.get(db_type_upper)
+        if compatible is not None:
+            return api_type.lower() in compatible
 
         return db_type_upper == api_type.upper()
 
 
+def _issues_to_dicts(issues: List[ValidationIssue]) -> List[Dict[str, Optional[str]]]:
+    """Serialize issues for the JSON report."""
+    return [
+        {
+            "severity": issue.severity,
+            "category": issue.category,
+            "message": issue.message,
+            "source_file": issue.source_file,
+            "target_file": issue.target_file
+        }
+        for issue in issues
+    ]
+
+
+def _format_issues(issues: List[ValidationIssue], parts: List[str]):
+    """Append the console lines for each issue to parts."""
+    for issue in issues:
+        parts.append(f"  [{issue.category}] {issue.message}")
+        parts.append(f"    Source: {issue.source_file}")
+        if issue.target_file:
+            parts.append(f"    Target: {issue.target_file}")
+        parts.append("")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate coherence across agent plans")
     parser.add_argument("--feature", required=True, help="Feature name")
@@ -418,66 +586,44 @@ def main():
     result = validator.validate()
 
     # Print results
-    print(f"\n{'='*60}")
-    print(f"Plan Validation Report: {args.feature}")
-    print(f"{'='*60}\n")
-    print(f"Status: {result.status}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Warnings: {len(result.warnings)}")
-    print()
-
-    if result.errors:
-        print("❌ ERRORS:")
-        for issue in result.errors:
-            print(f"  [{issue.category}] {issue.message}")
-            print(f"    Source: {issue.source_file}")
-            if issue.target_file:
-                print(f"    Target: {issue.target_file}")
-            print()
-
-    if result.warnings:
-        print("⚠️  WARNINGS:")
-        for issue in result.warnings:
-            print(f"  [{issue.category}] {issue.message}")
-            print(f"    Source: {issue.source_file}")
-            if issue.target_file:
-                print(f"    Target: {issue.target_file}")
-            print()
+    errors = result.errors
+    warnings = result.warnings
+    parts = [
+        f"\n{'='*60}",
+        f"Plan Validation Report: {args.feature}",
+        f"{'='*60}\n",
+        f"Status: {result.status}",
+        f"Errors: {len(errors)}",
+        f"Warnings: {len(warnings)}",
+        "",
+    ]
+
+    if errors:
+        parts.append("❌ ERRORS:")
+        _format_issues(errors, parts)
+
+    if warnings:
+        parts.append("⚠️  WARNINGS:")
+        _format_issues(warnings, parts)
 
     if result.status == "PASS":
-        print("✅ All plans are coherent. Ready to implement.")
+        parts.append("✅ All plans are coherent. Ready to implement.")
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
     # Save JSON report if output specified
     if args.output:
         report = {
             "feature": args.feature,
             "status": result.status,
-            "error_count": len(result.errors),
-            "warning_count": len(result.warnings),
-            "errors": [
-                {
-                    "severity": issue.severity,
-                    "category": issue.category,
-                    "message": issue.message,
-                    "source_file": issue.source_file,
-                    "target_file": issue.target_file
-                }
-                for issue in result.errors
-            ],
-            "warnings": [
-                {
-                    "severity": issue.severity,
-                    "category": issue.category,
-                    "message": issue.message,
-                    "source_file": issue.source_file,
-                    "target_file": issue.target_file
-                }
-                for issue in result.warnings
-            ]
+            "error_count": len(errors),
+            "warning_count": len(warnings),
+            "errors": _issues_to_dicts(errors),
+            "warnings": _issues_to_dicts(warnings)
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_jdumps(report))
 
         print(f"\nValidation report saved to: {args.output}")
 
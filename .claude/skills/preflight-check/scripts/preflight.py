@@ -10,17 +10,95 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
+import hashlib
 import json
+import mmap
 import os
 import re
-import shutil
-import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
-
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+try:
+    import orjson
+
+    def _jdumps(obj) -> bytes:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        # orjson cannot escape non-ASCII text; defer to json so the bytes match json.dump
+        return data if data.isascii() else json.dumps(obj, indent=2).encode("ascii")
+except ImportError:  # orjson is optional; fall back to stdlib json
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("ascii")
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Config files that indicate a configured test framework
+TEST_CONFIGS = frozenset({
+    "jest.config.js",
+    "jest.config.ts",
+    "vitest.config.ts",
+    "playwright.config.ts",
+    "pytest.ini",
+    "tox.ini",
+})
+
+# Substrings looked for in the feature context file and in CLAUDE.md. The
+# alternations sit inside a lookahead so overlapping occurrences (e.g. the
+# "Overview" in "TODOverview") are all seen, as with plain `in` tests.
+_CONTEXT_SCAN_RE = re.compile(rb"(?=(Overview|Objectives|TODO|TBD|FIXME|XXX))")
+_CONTEXT_TOKEN_COUNT = 6
+_CLAUDE_MD_SCAN_RE = re.compile(
+    r"(?=(\[stack\]|\[methodology\]|\[core_team\]"
+    r"|(?i:workflow[:\s]+(TDD|RAD|Standard))))"
+)
+_CLAUDE_MD_SECTION_COUNT = 3
+
+
+@functools.lru_cache(maxsize=16)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a text file, memoized on (path, mtime_ns, size) so edits invalidate it."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=8)
+def _find_executables(names: Tuple[str, ...], search_path: str) -> FrozenSet[str]:
+    """Which of names resolve to an executable on search_path, in one PATH walk.
+
+    Equivalent to calling shutil.which() per name, but each PATH directory is
+    listed once rather than probed once per name.
+    """
+    if os.name == "nt":
+        exts = [""] + os.environ.get("PATHEXT", "").lower().split(os.pathsep)
+        wanted = {(name + ext).lower(): name for name in names for ext in exts}
+    else:
+        wanted = {name: name for name in names}
 
-@dataclass
+    found = set()
+    for directory in search_path.split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    key = entry.name.lower() if os.name == "nt" else entry.name
+                    name = wanted.get(key)
+                    if (name and name not in found and not entry.is_dir()
+                            and os.access(entry.path, os.X_OK)):
+                        found.add(name)
+        except OSError:
+            continue
+        if len(found) == len(names):
+            break
+    return frozenset(found)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CheckResult:
     """Result of a single pre-flight check."""
     check_name: str
@@ -29,24 +107,45 @@ class CheckResult:
     fix_suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PreFlightReport:
     """Complete pre-flight check report."""
     feature: str
     overall_status: str  # "GO", "GO_WITH_WARNINGS", "NO_GO"
     checks: List[CheckResult] = field(default_factory=list)
-
-    @property
-    def passed(self) -> List[CheckResult]:
-        return [c for c in self.checks if c.status == "PASS"]
-
-    @property
-    def warnings(self) -> List[CheckResult]:
-        return [c for c in self.checks if c.status == "WARNING"]
-
-    @property
-    def failures(self) -> List[CheckResult]:
-        return [c for c in self.checks if c.status == "FAIL"]
+    # Status buckets filled by add(); checks keeps execution order for the JSON report
+    passed: List[CheckResult] = field(default_factory=list)
+    warnings: List[CheckResult] = field(default_factory=list)
+    failures: List[CheckResult] = field(default_factory=list)
+
+    def add(self, check: CheckResult):
+        """Record a check result in execution order and in its status bucket."""
+        self.checks.append(check)
+        if check.status == "PASS":
+            self.passed.append(check)
+        elif check.status == "WARNING":
+            self.warnings.append(check)
+        elif check.status == "FAIL":
+            self.failures.append(check)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "feature": self.feature,
+            "overall_status": self.overall_status,
+            "pass_count": len(self.passed),
+            "warning_count": len(self.warnings),
+            "fail_count": len(self.failures),
+            "checks": [
+                {
+                    "name": check.check_name,
+                    "status": check.status,
+                    "message": check.message,
+                    "fix_suggestion": check.fix_suggestion
+                }
+                for check in self.checks
+            ]
+        }
 
     def determine_overall_status(self):
         """Determine overall status based on check results."""
@@ -58,6 +157,42 @@ class PreFlightReport:
             self.overall_status = "GO"
 
 
+class _DirListing:
+    """One directory read that answers Path.exists()-style probes for its children.
+
+    Names missing from the listing in any case are missing without a syscall.
+    Listed names are confirmed with a stat that follows symlinks, so a dangling
+    link counts as missing. A name listed only in another case is stat'ed by
+    path, which resolves only on case-insensitive filesystems.
+    """
+
+    __slots__ = ("path", "entries", "folded")
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            with os.scandir(path) as it:
+                self.entries: Dict[str, os.DirEntry] = {entry.name: entry for entry in it}
+        except OSError:
+            self.entries = {}
+        self.folded: FrozenSet[str] = frozenset(name.casefold() for name in self.entries)
+
+    def stat(self, name: str) -> Optional[os.stat_result]:
+        """Stat a child as Path.exists() would see it, or None if it is missing."""
+        entry = self.entries.get(name)
+        try:
+            if entry is not None:
+                return entry.stat()
+            if name.casefold() in self.folded:
+                return os.stat(self.path / name)
+        except OSError:
+            pass
+        return None
+
+    def exists(self, name: str) -> bool:
+        return self.stat(name) is not None
+
+
 class PreFlightChecker:
     """Runs comprehensive pre-flight checks."""
 
@@ -65,20 +200,46 @@ class PreFlightChecker:
         self.feature = feature
         self.project_root = project_root
         self.report = PreFlightReport(feature=feature, overall_status="GO")
+        # Project root listing, read once and shared by every phase
+        self._root = _DirListing(project_root)
 
     def run_all_checks(self):
         """Run all pre-flight checks."""
-        self.check_context_file()
-        self.check_agent_availability()
-        self.check_claude_md()
-        self.check_git_status()
-        self.check_dependencies()
-        self.check_test_framework()
-        self.check_required_tools()
+        phases = [
+            PreFlightChecker.check_context_file,
+            PreFlightChecker.check_agent_availability,
+            PreFlightChecker.check_claude_md,
+            PreFlightChecker.check_git_status,
+            PreFlightChecker.check_dependencies,
+            PreFlightChecker.check_test_framework,
+            PreFlightChecker.check_required_tools,
+        ]
+
+        # The phases are independent and IO-bound, so they overlap on a thread
+        # pool; results are merged in phase order so the report order is stable
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [executor.submit(self._run_phase, phase) for phase in phases]
+            for future in futures:
+                for check in future.result():
+                    self.report.add(check)
 
         # Determine overall status
         self.report.determine_overall_status()
 
+    def _run_phase(self, phase) -> List[CheckResult]:
+        """Run one check phase against its own report and return its results."""
+        checker = copy.copy(self)
+        checker.report = PreFlightReport(feature=self.feature, overall_status="GO")
+        phase(checker)
+        return checker.report.checks
+
+    @functools.cached_property
+    def _trees(self) -> Optional[_DirListing]:
+        """Listing of .trees/, read once and only when the root listing shows it exists."""
+        if not self._root.exists(".trees"):
+            return None
+        return _DirListing(self.project_root / ".trees")
+
     # Phase 1: Context Validation
 
     def check_context_file(self):
@@ -99,7 +260,7 @@ class PreFlightChecker:
                     break
 
         if not context_file:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Context File Existence",
                 status="FAIL",
                 message=f"Context file not found for feature '{self.feature}'",
@@ -108,8 +269,9 @@ class PreFlightChecker:
             return
 
         # Check if file is empty
-        if context_file.stat().st_size == 0:
-            self.report.checks.append(CheckResult(
+        st = context_file.stat()
+        if st.st_size == 0:
+            self.report.add(CheckResult(
                 check_name="Context File Content",
                 status="FAIL",
                 message="Context file is empty",
@@ -118,21 +280,29 @@ class PreFlightChecker:
             return
 
         # Check for required sections
-        with open(context_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # One pass over a memory map of the file collects every required section
+        # and placeholder present; the tokens are ASCII, so no decode is needed.
+        # The scan stops as soon as every token has been seen.
+        seen = set()
+        with open(context_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for match in _CONTEXT_SCAN_RE.finditer(mapped):
+                    seen.add(match.group(1).decode('ascii'))
+                    if len(seen) == _CONTEXT_TOKEN_COUNT:
+                        break
 
         required_sections = ["Overview", "Objectives"]
-        missing_sections = [s for s in required_sections if s not in content]
+        missing_sections = [s for s in required_sections if s not in seen]
 
         if missing_sections:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Context File Structure",
                 status="WARNING",
                 message=f"Missing sections: {', '.join(missing_sections)}",
                 fix_suggestion="Update context file to include missing sections"
             ))
         else:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Context File",
                 status="PASS",
                 message=f"Context file exists and is valid: {context_file.name}"
@@ -140,10 +310,10 @@ class PreFlightChecker:
 
         # Check for placeholder text
         placeholders = ["TODO", "TBD", "FIXME", "XXX"]
-        found_placeholders = [p for p in placeholders if p in content]
+        found_placeholders = [p for p in placeholders if p in seen]
 
         if found_placeholders:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Context Completeness",
                 status="WARNING",
                 message=f"Found placeholder text: {', '.join(found_placeholders)}",
@@ -156,8 +326,18 @@ class PreFlightChecker:
         """Check if required agents are available."""
         agents_dir = self.project_root / ".claude" / "agents"
 
-        if not agents_dir.exists():
-            self.report.checks.append(CheckResult(
+        # One directory scan instead of a stat() per agent file; only the
+        # agent definition (.md) names are kept for the membership tests
+        try:
+            with os.scandir(agents_dir) as entries:
+                present = frozenset(entry.name for entry in entries if entry.name.endswith('.md'))
+        except FileNotFoundError:
+            present = None
+        except OSError:
+            present = frozenset()
+
+        if present is None:
+            self.report.add(CheckResult(
                 check_name="Agents Directory",
                 status="FAIL",
                 message="Agents directory not found: .claude/agents/",
@@ -168,21 +348,17 @@ class PreFlightChecker:
         # Detect required agents from context (simplified heuristic)
         required_agents = self._detect_required_agents()
 
-        missing_agents = []
-        for agent in required_agents:
-            agent_file = agents_dir / f"{agent}.md"
-            if not agent_file.exists():
-                missing_agents.append(agent)
+        missing_agents = [agent for agent in required_agents if f"{agent}.md" not in present]
 
         if missing_agents:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Agent Availability",
                 status="FAIL" if len(missing_agents) > 2 else "WARNING",
                 message=f"Missing agents: {', '.join(missing_agents)}",
                 fix_suggestion="Invoke @agent-librarian to draft missing agents"
             ))
         else:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Agent Availability",
                 status="PASS",
                 message=f"All {len(required_agents)} required agents available"
@@ -203,8 +379,9 @@ class PreFlightChecker:
         """Validate CLAUDE.md exists and has required sections."""
         claude_md = self.project_root / "CLAUDE.md"
 
-        if not claude_md.exists():
-            self.report.checks.append(CheckResult(
+        st = self._root.stat("CLAUDE.md")
+        if st is None:
+            self.report.add(CheckResult(
                 check_name="CLAUDE.md Existence",
                 status="FAIL",
                 message="CLAUDE.md not found at project root",
@@ -212,15 +389,25 @@ class PreFlightChecker:
             ))
             return
 
-        with open(claude_md, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_text_cached(str(claude_md), st.st_mtime_ns, st.st_size)
+
+        # One pass collects the sections present and the first workflow setting
+        seen = set()
+        workflow = None
+        for match in _CLAUDE_MD_SCAN_RE.finditer(content):
+            if match.group(2) is None:
+                seen.add(match.group(1))
+            elif workflow is None:
+                workflow = match.group(2)
+            if workflow is not None and len(seen) == _CLAUDE_MD_SECTION_COUNT:
+                break
 
         # Check required sections
         required_sections = ["[stack]", "[methodology]", "[core_team]"]
-        missing_sections = [s for s in required_sections if s not in content]
+        missing_sections = [s for s in required_sections if s not in seen]
 
         if missing_sections:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="CLAUDE.md Sections",
                 status="FAIL",
                 message=f"Missing sections: {', '.join(missing_sections)}",
@@ -229,67 +416,88 @@ class PreFlightChecker:
             return
 
         # Check methodology workflow
-        workflow_match = re.search(r'workflow[:\s]+(TDD|RAD|Standard)', content, re.IGNORECASE)
-        if not workflow_match:
-            self.report.checks.append(CheckResult(
+        if workflow is None:
+            self.report.add(CheckResult(
                 check_name="Methodology Workflow",
                 status="WARNING",
                 message="Workflow not set in [methodology] section",
                 fix_suggestion="Set workflow to 'TDD', 'RAD', or 'Standard'"
             ))
         else:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="CLAUDE.md Configuration",
                 status="PASS",
-                message=f"CLAUDE.md valid, workflow: {workflow_match.group(1)}"
+                message=f"CLAUDE.md valid, workflow: {workflow}"
             ))
 
     # Phase 4: Git Status
 
     def check_git_status(self):
         """Check git repository status."""
+        import subprocess  # only this phase spawns processes; keep it off the startup path
+
         try:
-            # Check if in git repo
-            result = subprocess.run(['git', 'rev-parse', '--git-dir'],
-                                    cwd=self.project_root,
-                                    capture_output=True,
-                                    text=True,
-                                    check=False)
-
-            if result.returncode != 0:
-                self.report.checks.append(CheckResult(
-                    check_name="Git Repository",
-                    status="WARNING",
-                    message="Not in a git repository",
-                    fix_suggestion="Initialize git: git init"
-                ))
+            # One NUL-delimited porcelain v2 status call; a non-zero exit means no repository
+            status_result = subprocess.run(['git', '-C', str(self.project_root),
+                                            'status', '--porcelain=v2', '-z'],
+                                           capture_output=True,
+                                           check=False)
+
+            if status_result.returncode != 0:
+                if self._is_git_repository(status_result.stderr):
+                    self.report.add(CheckResult(
+                        check_name="Git Status Check",
+                        status="WARNING",
+                        message=f"Git status check failed: {status_result.stderr.decode(errors='replace').strip()}",
+                        fix_suggestion="Verify git is installed and repository is valid"
+                    ))
+                else:
+                    self.report.add(CheckResult(
+                        check_name="Git Repository",
+                        status="WARNING",
+                        message="Not in a git repository",
+                        fix_suggestion="Initialize git: git init"
+                    ))
                 return
 
-            # Check for uncommitted changes
-            status_result = subprocess.run(['git', 'status', '--porcelain'],
-                                           cwd=self.project_root,
-                                           capture_output=True,
-                                           text=True,
-                                           check=True)
+            # Walk the NUL-terminated records without decoding them; rename/copy
+            # ("2 ") records carry an extra original-path field
+            out = status_result.stdout
+            changes = 0
+            has_conflicts = False
+            pos = 0
+            while pos < len(out):
+                end = out.find(b'\0', pos)
+                if end < 0:
+                    end = len(out)
+                kind = out[pos:pos + 2]
+                if kind == b'2 ':
+                    end = out.find(b'\0', end + 1)
+                    if end < 0:
+                        end = len(out)
+                elif kind == b'u ':
+                    has_conflicts = True
+                changes += 1
+                pos = end + 1
 
-            if status_result.stdout.strip():
-                lines = status_result.stdout.strip().split('\n')
-                self.report.checks.append(CheckResult(
+            # Check for uncommitted changes
+            if changes:
+                self.report.add(CheckResult(
                     check_name="Git Working Tree",
                     status="WARNING",
-                    message=f"{len(lines)} uncommitted changes detected",
+                    message=f"{changes} uncommitted changes detected",
                     fix_suggestion="Commit or stash changes before implementation"
                 ))
             else:
-                self.report.checks.append(CheckResult(
+                self.report.add(CheckResult(
                     check_name="Git Working Tree",
                     status="PASS",
                     message="Working tree is clean"
                 ))
 
-            # Check for merge conflicts
-            if any('UU' in line or 'AA' in line for line in status_result.stdout.split('\n')):
-                self.report.checks.append(CheckResult(
+            # Check for merge conflicts (unmerged entries start with "u ")
+            if has_conflicts:
+                self.report.add(CheckResult(
                     check_name="Git Merge Conflicts",
                     status="FAIL",
                     message="Merge conflicts detected",
@@ -298,80 +506,89 @@ class PreFlightChecker:
 
             # Check worktree existence
             worktree_path = self.project_root / ".trees" / f"feature-{self.feature}"
-            if worktree_path.exists():
-                self.report.checks.append(CheckResult(
+            if self._trees is not None and self._trees.exists(worktree_path.name):
+                self.report.add(CheckResult(
                     check_name="Git Worktree",
                     status="FAIL",
                     message=f"Worktree already exists: {worktree_path}",
                     fix_suggestion="Delete worktree: git worktree remove .trees/feature-{self.feature}"
                 ))
 
-        except subprocess.CalledProcessError as e:
-            self.report.checks.append(CheckResult(
+        except OSError as e:
+            self.report.add(CheckResult(
                 check_name="Git Status Check",
                 status="WARNING",
                 message=f"Git status check failed: {e}",
                 fix_suggestion="Verify git is installed and repository is valid"
             ))
 
+    def _is_git_repository(self, status_stderr: bytes) -> bool:
+        """Tell a failed git status outside a repository from one inside it."""
+        if b'not a git repository' in status_stderr:
+            return False
+        import subprocess
+
+        # The message may be localized; only then pay for a rev-parse call
+        result = subprocess.run(['git', '-C', str(self.project_root), 'rev-parse', '--git-dir'],
+                                capture_output=True,
+                                check=False)
+        return result.returncode == 0
+
     # Phase 5: Dependency Check
 
     def check_dependencies(self):
         """Check if project dependencies are installed."""
         # Check Node.js dependencies
-        package_json = self.project_root / "package.json"
-        if package_json.exists():
-            node_modules = self.project_root / "node_modules"
-            if not node_modules.exists():
-                self.report.checks.append(CheckResult(
+        if self._root.exists("package.json"):
+            if not self._root.exists("node_modules"):
+                self.report.add(CheckResult(
                     check_name="Node.js Dependencies",
                     status="WARNING",
                     message="node_modules/ not found",
                     fix_suggestion="Run: npm install"
                 ))
             else:
-                self.report.checks.append(CheckResult(
+                self.report.add(CheckResult(
                     check_name="Node.js Dependencies",
                     status="PASS",
                     message="node_modules/ exists"
                 ))
 
         # Check Python dependencies
-        requirements_txt = self.project_root / "requirements.txt"
-        if requirements_txt.exists():
+        if self._root.exists("requirements.txt"):
             # Check if virtual environment is activated (simplified)
             if not os.environ.get('VIRTUAL_ENV'):
-                self.report.checks.append(CheckResult(
+                self.report.add(CheckResult(
                     check_name="Python Dependencies",
                     status="WARNING",
                     message="Virtual environment not activated",
                     fix_suggestion="Activate venv: source venv/bin/activate"
                 ))
+            else:
+                self.report.add(CheckResult(
+                    check_name="Python Dependencies",
+                    status="PASS",
+                    message="Virtual environment activated"
+                ))
 
     # Phase 6: Test Framework
 
     def check_test_framework(self):
         """Check if test framework is configured."""
-        test_configs = [
-            "jest.config.js",
-            "jest.config.ts",
-            "vitest.config.ts",
-            "playwright.config.ts",
-            "pytest.ini",
-            "tox.ini"
-        ]
-
-        config_found = any((self.project_root / config).exists() for config in test_configs)
+        # Names in the listing narrow the candidates; a stat confirms each hit
+        config_found = any(
+            self._root.exists(name) for name in TEST_CONFIGS if name.casefold() in self._root.folded
+        )
 
         if not config_found:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Test Framework",
                 status="WARNING",
                 message="No test configuration found",
                 fix_suggestion="Configure test framework before implementation"
             ))
         else:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Test Framework",
                 status="PASS",
                 message="Test framework configured"
@@ -387,20 +604,20 @@ class PreFlightChecker:
             'gh': 'GitHub CLI (gh)',
         }
 
-        missing_tools = []
-        for tool, description in required_tools.items():
-            if not shutil.which(tool):
-                missing_tools.append(description)
+        found = _find_executables(tuple(required_tools), os.environ.get("PATH", os.defpath))
+        missing_tools = [
+            description for tool, description in required_tools.items() if tool not in found
+        ]
 
         if missing_tools:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Required Tools",
                 status="FAIL" if 'git' in missing_tools else "WARNING",
                 message=f"Missing tools: {', '.join(missing_tools)}",
                 fix_suggestion="Install missing tools before proceeding"
             ))
         else:
-            self.report.checks.append(CheckResult(
+            self.report.add(CheckResult(
                 check_name="Required Tools",
                 status="PASS",
                 message="All required CLI tools available"
@@ -409,43 +626,121 @@ class PreFlightChecker:
 
 def print_report(report: PreFlightReport):
     """Print formatted pre-flight report."""
-    print("\n" + "="*60)
-    print("PRE-FLIGHT CHECK REPORT")
-    print("="*60)
-    print(f"\nFeature: {report.feature}")
-    print(f"\nOVERALL STATUS: {report.overall_status}\n")
+    parts = [
+        "\n" + "="*60,
+        "PRE-FLIGHT CHECK REPORT",
+        "="*60,
+        f"\nFeature: {report.feature}",
+        f"\nOVERALL STATUS: {report.overall_status}\n",
+    ]
 
     if report.passed:
-        print(f"✅ PASS ({len(report.passed)}):")
+        parts.append(f"✅ PASS ({len(report.passed)}):")
         for check in report.passed:
-            print(f"  - {check.message}")
-        print()
+            parts.append(f"  - {check.message}")
+        parts.append("")
 
     if report.warnings:
-        print(f"⚠️  WARNING ({len(report.warnings)}):")
+        parts.append(f"⚠️  WARNING ({len(report.warnings)}):")
         for check in report.warnings:
-            print(f"  - {check.message}")
+            parts.append(f"  - {check.message}")
             if check.fix_suggestion:
-                print(f"    Fix: {check.fix_suggestion}")
-        print()
+                parts.append(f"    Fix: {check.fix_suggestion}")
+        parts.append("")
 
     if report.failures:
-        print(f"❌ FAIL ({len(report.failures)}):")
+        parts.append(f"❌ FAIL ({len(report.failures)}):")
         for check in report.failures:
-            print(f"  - {check.message}")
+            parts.append(f"  - {check.message}")
             if check.fix_suggestion:
-                print(f"    Fix: {check.fix_suggestion}")
-        print()
+                parts.append(f"    Fix: {check.fix_suggestion}")
+        parts.append("")
 
     # Recommendation
     if report.overall_status == "GO":
-        print("RECOMMENDATION: ✅ All checks passed. Proceed with implementation.")
+        parts.append("RECOMMENDATION: ✅ All checks passed. Proceed with implementation.")
     elif report.overall_status == "GO_WITH_WARNINGS":
-        print("RECOMMENDATION: ⚠️  Proceed with caution. Address warnings if possible.")
+        parts.append("RECOMMENDATION: ⚠️  Proceed with caution. Address warnings if possible.")
     else:
-        print("RECOMMENDATION: ❌ Cannot proceed. Resolve critical errors first.")
+        parts.append("RECOMMENDATION: ❌ Cannot proceed. Resolve critical errors first.")
+
+    parts.append("="*60 + "\n")
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+# Repeat runs within this window may reuse a cached report (opt-in via --cache)
+CACHE_TTL_SECONDS = 300
+
+
+def _cache_dir() -> Optional[Path]:
+    """Directory for cached reports, or None when the home directory is unknown."""
+    try:
+        return Path.home() / ".cache" / "preflight"
+    except (RuntimeError, KeyError):
+        return None
+
+
+def _mtime_ns(path: Path) -> int:
+    """Modification time of path in nanoseconds, or -1 if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _report_cache_key(feature: str, project_root: Path) -> str:
+    """Key a cached report on the feature, the inputs the checks read, and the environment."""
+    sessions_dir = project_root / ".claude" / "sessions"
+    watched = [
+        project_root,
+        project_root / "CLAUDE.md",
+        sessions_dir,
+        sessions_dir / f"context_session_feature_{feature}.md",
+        sessions_dir / f"context_session_{feature}.md",
+        project_root / ".claude" / "agents",
+        project_root / ".trees",
+        project_root / ".git" / "index",
+        project_root / ".git" / "HEAD",
+    ]
+    parts = [str(project_root), feature]
+    parts.extend(str(_mtime_ns(path)) for path in watched)
+    parts.append(os.environ.get("VIRTUAL_ENV", ""))
+    parts.append(os.environ.get("PATH", os.defpath))
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_cached_report(cache_file: Path) -> Optional[PreFlightReport]:
+    """Rebuild a report from a cache entry younger than CACHE_TTL_SECONDS."""
+    try:
+        if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        with open(cache_file, 'rb') as f:
+            data = json.load(f)
+
+        report = PreFlightReport(feature=data["feature"], overall_status=data["overall_status"])
+        for check in data["checks"]:
+            report.add(CheckResult(
+                check_name=check["name"],
+                status=check["status"],
+                message=check["message"],
+                fix_suggestion=check["fix_suggestion"]
+            ))
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or malformed entries just mean a fresh run
+        return None
+    return report
 
-    print("="*60 + "\n")
+
+def _store_cached_report(cache_file: Path, report: PreFlightReport):
+    """Write a cache entry atomically; a cache that cannot be written is skipped."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(_jdumps(report.to_dict()))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
 
 
 def main():
@@ -453,6 +748,9 @@ def main():
     parser.add_argument("--feature", required=True, help="Feature name")
     parser.add_argument("--project-root", default=".", help="Project root directory")
     parser.add_argument("--output", help="Output file for JSON report")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse a report from the last 5 minutes if the project looks unchanged "
+                             "(edits to tracked files that are not staged are not detected)")
 
     args = parser.parse_args()
 
@@ -460,35 +758,32 @@ def main():
     checker = PreFlightChecker(args.feature, project_root)
 
     print(f"Running pre-flight checks for feature: {args.feature}")
-    checker.run_all_checks()
+    cached = None
+    cache_file = None
+    if args.cache:
+        cache_dir = _cache_dir()
+        if cache_dir is not None:
+            cache_file = cache_dir / f"{_report_cache_key(args.feature, project_root)}.json"
+            cached = _load_cached_report(cache_file)
+
+    if cached is not None:
+        print("Using cached pre-flight result")
+        checker.report = cached
+    else:
+        checker.run_all_checks()
+        if cache_file is not None:
+            _store_cached_report(cache_file, checker.report)
 
     # Print report
     print_report(checker.report)
 
     # Save JSON report if requested
     if args.output:
-        report_dict = {
-            "feature": checker.report.feature,
-            "overall_status": checker.report.overall_status,
-            "pass_count": len(checker.report.passed),
-            "warning_count": len(checker.report.warnings),
-            "fail_count": len(checker.report.failures),
-            "checks": [
-                {
-                    "name": check.check_name,
-                    "status": check.status,
-                    "message": check.message,
-                    "fix_suggestion": check.fix_suggestion
-                }
-                for check in checker.report.checks
-            ]
-        }
-
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_jdumps(checker.report.to_dict()))
 
         print(f"Report saved to: {args.output}")
 